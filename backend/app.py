@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import copy
 import json
 import uuid
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -143,7 +145,7 @@ def ui_to_answers(payload: Dict[str, Any]) -> Dict[str, str]:
     elif household == "couple":
         family = "Couple"
     elif household == "family":
-        ages_txt = ", ".join([str(a).strip() for a in children_ages if str(a).strip()])
+        ages_txt = ", ".join([t for a in children_ages if (t := str(a).strip())])
         family = (
             f"Family with {children_count} children (ages: {ages_txt})"
             if ages_txt
@@ -389,6 +391,18 @@ def brief_final(payload: Dict[str, Any]):
     }
 
 
+@lru_cache(maxsize=64)
+def _load_norm_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parsed norm.json per file version, shared between requests.
+
+    Callers get a copy to work on; the shared object only serves as the QA cache
+    key (norm_key), so QA caches hit for repeat questions on the same version.
+    Parse errors propagate so they are not memoized: a file caught mid-write is
+    re-read on the next request instead of sticking as {} for that mtime.
+    """
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
 @app.post("/brief/qa")
 def brief_qa(payload: Dict[str, Any]):
     brief_id = (payload.get("brief_id") or "").strip()
@@ -407,9 +421,10 @@ def brief_qa(payload: Dict[str, Any]):
 
     md_text = md_path.read_text(encoding="utf-8")
     try:
-        norm = json.loads(norm_path.read_text(encoding="utf-8"))
+        norm_key: Any = _load_norm_cached(str(norm_path), norm_path.stat().st_mtime_ns)
     except Exception:
-        norm = {}
+        norm_key = None
+    norm = copy.deepcopy(norm_key) if norm_key is not None else {}
 
     try:
         data = answer_question(
@@ -418,6 +433,7 @@ def brief_qa(payload: Dict[str, Any]):
             md_text=md_text,
             norm=norm,
             mode=mode,
+            norm_key=norm_key,
         )
     except RuntimeError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -434,6 +450,7 @@ def brief_qa(payload: Dict[str, Any]):
                 "answer": data.get("answer"),
                 "citations": data.get("citations"),
                 "confidence": data.get("confidence"),
+                "source": data.get("source"),
             },
             OUT_DIR,
         )
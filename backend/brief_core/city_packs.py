@@ -2,9 +2,15 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:  # optional: faster parsing of the (large) pack files
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
 
 def _normalize_city_key(city: str) -> str:
     """Normalize user/UI city strings into a stable city-pack key.
@@ -24,7 +30,7 @@ def _normalize_city_key(city: str) -> str:
 
     # Split common composite formats
     parts = re.split(r"[,/|\\-]+", s)
-    parts = [p.strip() for p in parts if p and p.strip()]
+    parts = [t for p in parts if p and (t := p.strip())]
     # Often "Belgium/Brussels" → pick last, but "Brussels, Belgium" → pick first.
     countries = {
         "belgium", "be", "spain", "es", "france", "fr", "italy", "it", "germany", "de",
@@ -51,16 +57,40 @@ def _normalize_city_key(city: str) -> str:
 
 
 def load_city_pack(city: str) -> Optional[Dict[str, Any]]:
+    """Load the city pack for a user/UI city string.
+
+    Packs are static files shipped with the app, so the file is read once per key;
+    each call parses it afresh and returns a pack the caller owns and may modify.
+    """
     if not city:
         return None
     key = _normalize_city_key(city)
     if not key:
         return None
+    raw = _read_city_pack_file(key)
+    if raw is None:
+        return None
+    try:
+        return _parse_pack(raw)
+    except Exception:
+        return None
+
 
+@lru_cache(maxsize=32)
+def _read_city_pack_file(key: str) -> Optional[bytes]:
     pack_path = Path(__file__).resolve().parent.parent / "city_packs" / f"{key}.json"
     if not pack_path.exists():
         return None
     try:
-        return json.loads(pack_path.read_text(encoding="utf-8"))
-    except Exception:
+        return pack_path.read_bytes()
+    except OSError:
         return None
+
+
+def _parse_pack(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals, which the stdlib parser accepts
+    return json.loads(raw)
@@ -10,7 +10,8 @@ computed in normalize.py (Safety/Family/Commute/Lifestyle/BudgetFit).
 """
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+from operator import itemgetter
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 
 DIMENSIONS = ("Safety", "Family", "Commute", "Lifestyle", "BudgetFit")
@@ -99,32 +100,36 @@ def rank_communes(
     # when profile scores are close.
     swap_overall_gap: int = 2,
     swap_profile_eps: float = 0.45,
+    limit: Optional[int] = None,
 ) -> List[Dict[str, object]]:
     """Rank communes by profile score, then reconcile to avoid Overall contradictions.
 
     Input list items must include:
       - name: str
       - scores: dict with 5 dimensions + Overall
+
+    The full list is always ordered (the reconcile pass can promote any item);
+    ``limit`` only trims what is returned and annotated with rank metadata.
     """
 
-    items: List[Dict[str, object]] = []
+    # (sort key, item): the key is computed once per commune, not per comparison
+    # or reconcile pass. key = (profile_score, Overall, Family, Safety).
+    keyed: List[Tuple[Tuple[float, int, int, int], Dict[str, object]]] = []
     for c in communes:
-        sc = dict(c.get("scores") or {})
+        sc = c.get("scores") or {}
         ps = profile_score(sc, weights.by_dim)
         c2 = dict(c)
         c2["profile_score"] = ps
-        items.append(c2)
+        key = (
+            float(ps or 0.0),
+            int(sc.get("Overall", 0)),
+            int(sc.get("Family", 0)),
+            int(sc.get("Safety", 0)),
+        )
+        keyed.append((key, c2))
 
     # Primary ordering: profile score, then Overall, then Family/Safety.
-    items.sort(
-        key=lambda d: (
-            float(d.get("profile_score") or 0.0),
-            int((d.get("scores") or {}).get("Overall", 0)),
-            int((d.get("scores") or {}).get("Family", 0)),
-            int((d.get("scores") or {}).get("Safety", 0)),
-        ),
-        reverse=True,
-    )
+    keyed.sort(key=itemgetter(0), reverse=True)
 
     # Reconcile to reduce obvious contradictions:
     # If two adjacent communes have close profile scores, but the lower one has
@@ -132,24 +137,25 @@ def rank_communes(
     swapped = True
     while swapped:
         swapped = False
-        for i in range(len(items) - 1):
-            a = items[i]
-            b = items[i + 1]
-            a_ps = float(a.get("profile_score") or 0.0)
-            b_ps = float(b.get("profile_score") or 0.0)
-            a_o = int((a.get("scores") or {}).get("Overall", 0))
-            b_o = int((b.get("scores") or {}).get("Overall", 0))
+        for i in range(len(keyed) - 1):
+            (a_ps, a_o, _, _), _ = keyed[i]
+            (b_ps, b_o, _, _), _ = keyed[i + 1]
             if (b_o - a_o) >= swap_overall_gap and (a_ps - b_ps) <= swap_profile_eps:
-                items[i], items[i + 1] = items[i + 1], items[i]
+                keyed[i], keyed[i + 1] = keyed[i + 1], keyed[i]
                 swapped = True
 
+    if limit is not None:
+        keyed = keyed[:limit]
+
     # Attach ranking debug.
-    for idx, c in enumerate(items, start=1):
+    items: List[Dict[str, object]] = []
+    for idx, ((ps, overall, _, _), c) in enumerate(keyed, start=1):
         c["rank"] = idx
         c["rank_debug"] = {
-            "profile_score": float(c.get("profile_score") or 0.0),
-            "overall": int((c.get("scores") or {}).get("Overall", 0)),
+            "profile_score": ps,
+            "overall": overall,
             "weights": weights.debug,
         }
+        items.append(c)
 
     return items
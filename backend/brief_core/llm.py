@@ -1,8 +1,10 @@
 import json
 import re
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from json import JSONDecodeError
 
 from openai import OpenAI
@@ -10,18 +12,21 @@ from openai import OpenAI
 from .city_packs import load_city_pack
 
 
-def _load_microhood_commune_map() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def _load_microhood_commune_map() -> Mapping[str, str]:
     """Map microhood name variants -> commune_en using monitoring_quartiers_full.geojson.
 
     This is used as a validator so the LLM cannot recommend microhoods outside a commune.
+    The geojson ships with the app, so the map is built once per process and returned
+    read-only; call ``_load_microhood_commune_map.cache_clear()`` after swapping the file.
     """
     geo_path = Path(__file__).resolve().parent.parent / "city_packs" / "monitoring_quartiers_full.geojson"
     if not geo_path.exists():
-        return {}
+        return MappingProxyType({})
     try:
         data = json.loads(geo_path.read_text(encoding="utf-8"))
     except Exception:
-        return {}
+        return MappingProxyType({})
 
     def _norm(s: str) -> str:
         return re.sub(r"\s+", " ", (s or "").strip().lower())
@@ -36,7 +41,7 @@ def _load_microhood_commune_map() -> Dict[str, str]:
             nm = str(props.get(k) or "").strip()
             if nm:
                 out[_norm(nm)] = commune
-    return out
+    return MappingProxyType(out)
 
 
 SYSTEM_INSTRUCTIONS = """You are a B2B relocation brief assistant.
@@ -209,7 +214,7 @@ def _parse_json_with_repair(client: OpenAI, model: str, raw_text: str, tag: str)
 def _split_csv(value: str) -> list[str]:
     if not value:
         return []
-    return [v.strip() for v in str(value).split(",") if v.strip()]
+    return [t for v in str(value).split(",") if (t := v.strip())]
 
 
 def _rank_communes_by_tags(pack: Dict[str, Any], priority_ids: list[str], top3_ids: list[str], k: int = 7) -> list[Dict[str, Any]]:
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def identity_cache(
+    store: Dict[Hashable, Tuple[Any, T]],
+    max_size: int,
+    obj: Any,
+    build: Callable[[], T],
+    key: Optional[Hashable] = None,
+) -> T:
+    """Return build() for *obj*, computed once for as long as obj is the same object.
+
+    Entries are keyed on id(obj) (or an explicit *key*) and hold obj itself: the
+    reference keeps the id from being reused while the entry is alive, and a hit
+    must be that very object, so a replaced input is rebuilt. The stores are small
+    and an entry only pays off while its input is in use, so a full store is simply
+    cleared rather than evicted entry by entry.
+    """
+    k = id(obj) if key is None else key
+    hit = store.get(k)
+    if hit is not None and hit[0] is obj:
+        return hit[1]
+    value = build()
+    if len(store) >= max_size:
+        store.clear()
+    store[k] = (obj, value)
+    return value
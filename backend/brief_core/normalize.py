@@ -10,16 +10,34 @@ Goals:
 5) Make the brief multi-page friendly (no aggressive truncation).
 """
 
+import hashlib
 import json
+import os
 import re
+import tempfile
+import unicodedata
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Collection, Dict, FrozenSet, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+try:  # optional: stream the microhood geojson instead of materializing it
+    import ijson
+except ImportError:  # pragma: no cover - plain json fallback
+    ijson = None
+
+try:  # optional: faster parsing of the geojson fallback and cache entries
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
 from .city_packs import load_city_pack
-from .quality_gate import run_quality_gate
+from .quality_gate import DASH_TRANSLATE, run_quality_gate
 from .microhood_ranker import rank_microhoods_for_commune
 from .tag_registry import TAG_REGISTRY
 from .commune_ranker import build_commune_rank_weights, rank_communes
+from .memo import identity_cache
 
 # --- Scoring model (used for Trust & method copy + debug output) ---
 SCORE_MODEL: Dict[str, Any] = {
@@ -52,6 +70,21 @@ SCORE_MODEL: Dict[str, Any] = {
     },
 }
 
+# Score dimensions (Overall is derived from the first five).
+SCORE_KEYS: Tuple[str, ...] = ("Safety", "Family", "Commute", "Lifestyle", "BudgetFit")
+ALL_SCORE_KEYS: Tuple[str, ...] = SCORE_KEYS + ("Overall",)
+
+# Casefolded score-key variants seen in LLM output -> canonical key.
+SCORE_KEY_ALIASES: Dict[str, str] = {
+    "budget_fit": "BudgetFit",
+    "budgetfit": "BudgetFit",
+    "overall": "Overall",
+    "safety": "Safety",
+    "family": "Family",
+    "commute": "Commute",
+    "lifestyle": "Lifestyle",
+}
+
 
 # High-level caps (multi-page report, so keep them generous)
 LIMITS = {
@@ -68,6 +101,145 @@ LIMITS = {
     "microhoods": 3,
 }
 
+# Precompiled patterns for the text helpers below (hot path: every bullet/label).
+_RE_DASH_WS = re.compile(r"\s*-\s*")
+_RE_MULTI_SPACE = re.compile(r"\s{2,}")
+_RE_WS = re.compile(r"\s+")
+_RE_MONEY = re.compile(r"\s*(?:(?P<num>[0-9]+(?:[\.,][0-9]+)?)\s*(?P<suf>[kKmM])|(?P<digits>[0-9]+))\s*")
+_RE_INT = re.compile(r"\s*-?\d+\s*\Z")
+_RE_NON_DIGIT = re.compile(r"[^0-9]")
+_RE_DASH_VARIANTS = re.compile(r"[–—]")
+# Substrings (not whole words: "parc" also catches "parcours") that mark a
+# microhood label as a park/forest/cemetery landmark.
+_RE_LANDMARK_WORDS = re.compile("foret|forêt|forest|parc|park|bois|cemet|cimet")
+_RE_PARENS = re.compile(r"\s*\([^)]*\)")
+# _as_list separators: newline/semicolon fold onto "," so a plain str.split suffices.
+_LIST_SEP_TRANSLATE = str.maketrans({"\n": ",", ";": ","})
+
+# Single-pass character map for _clean_text: the quality gate's dash/space table
+# (no-break/thin spaces, invisible joiners, hyphen/box glyphs) plus typographic quotes.
+_CLEAN_TRANSLATE = {
+    **DASH_TRANSLATE,
+    **str.maketrans({
+        "\u2019": "'",
+        "\u201c": '"',
+        "\u201d": '"',
+    }),
+}
+
+
+# Answer fields echoed in the methodology block, in display order.
+METHODOLOGY_INPUT_LABELS: Tuple[Tuple[str, str], ...] = (
+    ("housing_type", "Housing type: "),
+    ("budget_rent", "Budget (rent): "),
+    ("budget_buy", "Budget (buy): "),
+    ("office_commute", "Work commute: "),
+    ("school_commute", "School commute: "),
+)
+
+
+# Fixed lead-in lines of the methodology "matching" list.
+METHODOLOGY_MATCHING_STATIC: Tuple[str, ...] = (
+    "We only recommend communes and microhoods from the city pack (no invented areas).",
+    "Scores are computed from city-pack signals (amenities, transport, parks) + your budget.",
+)
+
+
+# Deterministic defaults for normalize_brief. Kept as tuples so every brief gets
+# fresh lists (list(...)) while the literals are built once at import.
+DEFAULT_NEXT_STEPS_BUY: Tuple[str, ...] = (
+    "Shortlist 8–12 listings across the 3 communes and set up viewings.",
+    "Confirm total purchase cost: price + notary/registration fees + recurring charges.",
+    "Validate commute: run one test route at peak hours (public transport and by car if relevant).",
+    "Ask about parking (permit vs private spot), storage, and building rules.",
+    "Prepare a document pack for offers: ID, proof of funds/pre-approval, and key questions for the seller.",
+    "Request EPC, urbanism/permit docs, and recent syndic/HOA minutes before committing.",
+    "Do an evening walk-through for your top 2 choices to assess noise and street feel.",
+    "Plan your notary steps and financing timeline; align deed date with your move plan.",
+    "Book a second visit with measurements/photos to compare objectively.",
+    "If needed, line up a survey/technical inspection for building issues.",
+)
+
+DEFAULT_NEXT_STEPS_RENT: Tuple[str, ...] = (
+    "Shortlist 8–12 listings across the 3 communes and set up viewings.",
+    "Confirm total monthly cost: rent + charges + utilities (and what's included).",
+    "Validate commute: run one test route at peak hours (public transport and by car if relevant).",
+    "Ask about parking rules/permits and bike/storage options.",
+    "Prepare a rental document pack: ID, proof of income, employer letter, bank statements.",
+    "For the top 2 options, do an evening walk-through to assess noise and safety.",
+    "Clarify contract length, notice period, indexation, and deposit rules.",
+    "Book a second visit with measurements and photos to compare objectively.",
+    "Pre-validate a rental guarantee to move fast on good listings.",
+    "Confirm handover checklist and inventory (appliances/fixtures) in writing.",
+)
+
+DEFAULT_VIEWING_CHECKLIST: Tuple[str, ...] = (
+    "Noise: check windows closed/open, street vs courtyard orientation.",
+    "Heating & insulation: type, EPC score, drafts, humidity/mold signs.",
+    "Charges: what's included (common areas, heating, water) and past statements.",
+    "Building works: planned renovations, roof/façade, lift, syndic notes.",
+    "Internet/cell coverage: quick speed test on site.",
+    "Storage: cellar, bike room, stroller access, elevator size.",
+    "Parking: permit eligibility, private spot, guest parking, EV charging.",
+    "Safety basics: entrance, lighting, intercom, visibility at night.",
+)
+
+DEFAULT_OFFER_STRATEGY: Tuple[str, ...] = (
+    "Move quickly on strong listings: good units can disappear within days.",
+    "Clarify conditions (financing, sale of current property) early; keep them realistic.",
+    "Ask for EPC, urbanism info, and syndic documents before committing (buying).",
+    "Confirm timelines: offer validity, deed date (buying) or move-in date (renting).",
+    "Negotiate on total package: included furniture, repairs, parking spot, charges.",
+)
+
+# (section key, default items) in display order.
+DEFAULT_RELOCATION_ESSENTIALS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("first_72h", (
+        "Set up a local SIM / data plan and enable 2FA for banking.",
+        "Confirm temporary address and keep copies of the lease / purchase agreement.",
+        "Book commune appointment for registration (as soon as address is confirmed).",
+    )),
+    ("first_2_weeks", (
+        "Register at the commune (address registration); follow up on police check if required.",
+        "Choose a GP (médecin généraliste) and register with a mutualité (health fund).",
+        "Arrange energy + internet contracts if not included (electricity/gas/internet).",
+        "If you have a child: shortlist daycare/schools and start the application process.",
+    )),
+    ("first_2_months", (
+        "Set up a Belgian bank account if needed and update payroll details.",
+        "Review insurance (home contents, liability); confirm coverage start date.",
+        "If driving: confirm parking permit process, resident rules, and any LEZ requirements.",
+    )),
+)
+
+DEFAULT_REGISTRATION_CHECKLIST: Tuple[str, ...] = (
+    "Valid passport/ID + visa/residence documents (if applicable).",
+    "Proof of address: signed lease / deed / housing attestation.",
+    "Civil status docs if relevant (marriage/birth certificates) — bring originals and copies.",
+    "Work proof: contract or employer letter (useful for some registrations).",
+    "Keep digital scans of all documents and a folder for commune appointments.",
+    "Confirm appointment booking channel (commune website/IRISbox when applicable) and required forms.",
+)
+
+
+# Tenure-specific viewing-checklist lines: appended to the default checklist and
+# swapped in when sanitizing an LLM checklist written for the other mode.
+_VIEWING_APPLIANCES_RENT = "Appliances/fixtures: inventory list and condition (rental check-in)."
+_VIEWING_BUDGET_BUY = "Total budget: mortgage + recurring charges + utilities + insurance + taxes."
+_VIEWING_BUDGET_RENT = "Total budget: rent + charges + utilities + insurance."
+
+
+def _methodology_block(inputs: List[str], priorities: str, shortlist: str) -> Dict[str, List[str]]:
+    """Build a fresh methodology dict (callers may mutate it downstream)."""
+    return {
+        "inputs": inputs,
+        "matching": [
+            *METHODOLOGY_MATCHING_STATIC,
+            f"Priority tags matched: {priorities}.",
+            f"Shortlist produced: {shortlist}.",
+        ],
+    }
+
 
 # --- Premium report normalization helpers ---
 
@@ -75,27 +247,30 @@ def _normalize_dashes(s: str) -> str:
     """Normalize spacing around hyphens: 'Saint - Job' -> 'Saint-Job'."""
     if not s:
         return ""
+    # The common 'A - B' form needs no regex; only odd spacing (tabs, double
+    # spaces, one-sided gaps around a hyphen) falls through to the passes below.
+    s = s.replace(" - ", "-")
+    if " -" not in s and "- " not in s and "  " not in s and s.isprintable():
+        return s.strip()
     # collapse whitespace around hyphen
-    s = re.sub(r"\s*-\s*", "-", s)
+    s = _RE_DASH_WS.sub("-", s)
     # collapse multiple spaces
-    s = re.sub(r"\s{2,}", " ", s)
+    s = _RE_MULTI_SPACE.sub(" ", s)
     return s.strip()
 
 
-def _dedupe_str_list(items):
+def _dedupe_str_list(items: Any) -> List[str]:
     """Case-insensitive stable dedupe + trim; drops empties."""
-    out = []
-    seen = set()
+    # dict keeps insertion order: first spelling of each key wins.
+    first: Dict[str, str] = {}
     for it in items or []:
         s = (it or "").strip()
         if not s:
             continue
-        key = s.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(_normalize_dashes(s))
-    return out
+        key = (s if s.isascii() else unicodedata.normalize("NFC", s)).casefold()
+        if key not in first:
+            first[key] = _normalize_dashes(s)
+    return list(first.values())
 
 
 
@@ -113,49 +288,85 @@ def _clean_text(s: object) -> str:
     if not isinstance(s, str):
         s = str(s)
 
-    # Normalize whitespace / joiners
-    for ch in (" ", " ", " "):
-        s = s.replace(ch, " ")
-    for ch in ("⁠", "​", "﻿"):
-        s = s.replace(ch, "")
-
-    # Normalize punctuation / hyphens
-    s = (s
-         .replace("’", "'")
-         .replace("“", '"')
-         .replace("”", '"')
-         .replace("‑", "-")  # non-breaking hyphen
-         .replace("‐", "-")  # hyphen
-         .replace("–", "-")  # en dash
-         .replace("—", "-")  # em dash
-         .replace("■", "-")
-         .replace("□", "-")
-         .replace("▪", "-")
-         .replace("▫", "-")
-    )
+    if s.isascii() and "-" not in s:
+        # Fast path: nothing to translate and no hyphen spacing to fix, so only the
+        # whitespace collapse remains (str.split() uses the same whitespace set as \s).
+        return " ".join(s.split())
+
+    # Compose decomposed accents (e + U+0301 -> é) so downstream dedupe/matching
+    # sees one form. NFC leaves the typographic hyphens alone, hence the table below.
+    s = unicodedata.normalize("NFC", s)
+
+    # Normalize whitespace / joiners / punctuation / hyphens in one pass
+    s = s.translate(_CLEAN_TRANSLATE)
 
     s = _normalize_dashes(s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _RE_WS.sub(" ", s).strip()
     return s
 
 
-def _clean_bullets(items):
+def _clean_bullets(items: Any) -> List[str]:
     """Remove empty bullets + normalize dashes + dedupe."""
     return _dedupe_str_list(items)
 
 
-def _safe_int(v, default=0):
+def _safe_int(v: Any, default: int = 0) -> int:
+    # Score cells are almost always plain ints or digit strings; only odd
+    # values ("4.0", "", None, inf) pay for the try/except below.
+    if type(v) is int:
+        return v
+    if type(v) is str and _RE_INT.match(v):
+        return int(v)
     try:
         return int(v)
     except Exception:
         return default
 
 
-def _recalc_overall(scores: dict) -> int:
+def _parses_as_int(v: Any) -> bool:
+    """True when int(v) succeeds (the strict check _safe_int falls back from)."""
+    if type(v) is int:
+        return True
+    try:
+        int(v)
+    except Exception:
+        return False
+    return True
+
+
+def _scores_parse_as_ints(scores: Any) -> bool:
+    """True when every SCORE_KEYS value in *scores* (missing -> 0) passes _parses_as_int."""
+    sc = scores or {}
+    return isinstance(sc, dict) and all(_parses_as_int(sc.get(k, 0)) for k in SCORE_KEYS)
+
+
+class ScoreVec(NamedTuple):
+    """Read-only view of a district's 1..5 scores (missing/invalid -> 0)."""
+
+    safety: int
+    family: int
+    commute: int
+    lifestyle: int
+    budget_fit: int
+    overall: int
+
+    @classmethod
+    def from_scores(cls, scores: Optional[Dict[str, Any]]) -> "ScoreVec":
+        sc = scores or {}
+        return cls(
+            _safe_int(sc.get("Safety", 0), 0),
+            _safe_int(sc.get("Family", 0), 0),
+            _safe_int(sc.get("Commute", 0), 0),
+            _safe_int(sc.get("Lifestyle", 0), 0),
+            _safe_int(sc.get("BudgetFit", 0), 0),
+            _safe_int(sc.get("Overall", 0), 0),
+        )
+
+
+def _recalc_overall(scores: Dict[str, Any]) -> int:
     """Overall = rounded average of 5 dimensions. Returned as 1..5 int."""
-    keys = ["Safety", "Family", "Commute", "Lifestyle", "BudgetFit"]
     vals = []
-    for k in keys:
+    for k in SCORE_KEYS:
         if k in scores:
             vals.append(_safe_int(scores.get(k), 0))
     if not vals:
@@ -166,7 +377,90 @@ def _recalc_overall(scores: dict) -> int:
     return max(1, min(5, overall))
 
 
-def _postprocess_brief(out: dict) -> dict:
+# --- Optional disk cache for _postprocess_brief ---
+# Off unless POSTPROCESS_CACHE_DIR is set (retries / PDF re-downloads of the same
+# brief then skip the pass). Bump the version whenever the pass changes so
+# stale entries stop matching.
+_POSTPROCESS_CACHE_VERSION = "1"
+_POSTPROCESS_CACHE_MAX_FILES = 512
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, else the stdlib parser."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _postprocess_cache_dir() -> Optional[Path]:
+    raw = (os.environ.get("POSTPROCESS_CACHE_DIR") or "").strip()
+    return Path(raw) if raw else None
+
+
+def _postprocess_cache_key(out: Dict[str, Any]) -> Optional[str]:
+    try:
+        payload = json.dumps(out, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    except (TypeError, ValueError):
+        # Not plain JSON (odd key types, custom objects): don't cache.
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_POSTPROCESS_CACHE_VERSION.encode("ascii"))
+    h.update(payload.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _postprocess_cache_get(cache_dir: Path, key: str) -> Optional[Dict[str, Any]]:
+    path = cache_dir / f"{key}.json"
+    try:
+        data = _json_loads(path.read_bytes())
+        os.utime(path)  # mark as recently used for the sweep below
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _postprocess_cache_put(cache_dir: Path, key: str, out: Dict[str, Any]) -> None:
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / f"{key}.json"
+        data = json.dumps(out, ensure_ascii=False)
+        # Unique temp name per write: threads of one worker may store the same key.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_dir, prefix=f"{key}.", suffix=".tmp", delete=False
+        ) as fp:
+            tmp = fp.name
+            fp.write(data)
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            os.remove(tmp)
+            raise
+        # Least-recently-used sweep once the directory grows past the cap.
+        entries = [e for e in os.scandir(cache_dir) if e.name.endswith(".json")]
+        if len(entries) > _POSTPROCESS_CACHE_MAX_FILES:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for e in entries[: len(entries) - _POSTPROCESS_CACHE_MAX_FILES]:
+                os.remove(e.path)
+    except Exception:
+        # Caching is best-effort; never fail a brief because of it.
+        pass
+
+
+def _postprocess_brief(out: Dict[str, Any]) -> Dict[str, Any]:
+    """Final consistency pass for premium PDF rendering (disk-cached when enabled)."""
+    cache_dir = _postprocess_cache_dir()
+    key = _postprocess_cache_key(out) if cache_dir else None
+    if key:
+        hit = _postprocess_cache_get(cache_dir, key)
+        if hit is not None:
+            return hit
+    out = _postprocess_brief_uncached(out)
+    if key:
+        _postprocess_cache_put(cache_dir, key, out)
+    return out
+
+
+def _postprocess_brief_uncached(out: Dict[str, Any]) -> Dict[str, Any]:
     """Final consistency pass for premium PDF rendering."""
     # Normalize / dedupe top-level bullets
     for k in ["must_have", "nice_to_have", "red_flags", "contradictions"]:
@@ -180,6 +474,7 @@ def _postprocess_brief(out: dict) -> dict:
 
     # Normalize / enrich commune blocks
     districts = out.get("top_districts") or []
+    score_vecs: List[ScoreVec] = []
     for d in districts:
         d["commune"] = _normalize_dashes(d.get("commune", ""))
         # score keys may vary
@@ -190,24 +485,15 @@ def _postprocess_brief(out: dict) -> dict:
             if not kk:
                 continue
             key = kk.strip()
-            # common variants
-            key_map = {
-                "budget_fit": "BudgetFit",
-                "budgetfit": "BudgetFit",
-                "overall": "Overall",
-                "safety": "Safety",
-                "family": "Family",
-                "commute": "Commute",
-                "lifestyle": "Lifestyle",
-            }
-            k2 = key_map.get(key.casefold(), key)
+            k2 = SCORE_KEY_ALIASES.get(key.casefold(), key)
             norm_scores[k2] = vv
         # ensure ints
-        for k2 in ["Safety", "Family", "Commute", "Lifestyle", "BudgetFit", "Overall"]:
+        for k2 in ALL_SCORE_KEYS:
             if k2 in norm_scores:
                 norm_scores[k2] = _safe_int(norm_scores.get(k2), 0)
         norm_scores["Overall"] = _recalc_overall(norm_scores)
         d["scores"] = norm_scores
+        score_vecs.append(ScoreVec.from_scores(norm_scores))
 
         # microhoods schema normalization
         # Sprint-2+ update: remove generic Street hints / Avoid blocks (they were identical
@@ -253,15 +539,13 @@ def _postprocess_brief(out: dict) -> dict:
     if any(isinstance(d, dict) and ("rank" in d or "profile_score" in d) for d in districts):
         out["top_districts"] = districts
     else:
-        def _sort_key(d):
-            s = (d.get("scores") or {})
-            return (
-                _safe_int(s.get("Overall"), 0),
-                _safe_int(s.get("Family"), 0),
-                _safe_int(s.get("Safety"), 0),
-            )
-
-        out["top_districts"] = sorted(districts, key=_sort_key, reverse=True)
+        # Decorate once and sort plain tuples; -i keeps ties in input order
+        # under reverse=True, like the stable key-based sort did.
+        decorated = sorted(
+            ((v.overall, v.family, v.safety, -i) for i, v in enumerate(score_vecs)),
+            reverse=True,
+        )
+        out["top_districts"] = [districts[-t[3]] for t in decorated]
     return out
 
 
@@ -328,17 +612,19 @@ def _parse_money(value: Any) -> Optional[int]:
     if not s:
         return None
 
-    # Handle suffixes like 1.2M / 750k
-    m = re.match(r"^\s*([0-9]+(?:[\.,][0-9]+)?)\s*([kKmM])\s*$", s)
+    # One pass covers the common shapes: suffixes like 1.2M / 750k, or plain digits.
+    m = _RE_MONEY.fullmatch(s)
     if m:
-        num = float(m.group(1).replace(",", "."))
-        suf = m.group(2).lower()
-        return int(num * (1_000 if suf == "k" else 1_000_000))
+        if m.group("suf"):
+            num = float(m.group("num").replace(",", "."))
+            suf = m.group("suf").lower()
+            return int(num * (1_000 if suf == "k" else 1_000_000))
+        return int(m.group("digits"))
 
     # Strip currency symbols and keep digits.
     # NOTE: ranges like "745000-1205000" are NOT supported here because this
     # would concatenate the digits. Use _parse_money_range() for ranges.
-    digits = re.sub(r"[^0-9]", "", s)
+    digits = _RE_NON_DIGIT.sub("", s)
     if not digits:
         return None
     try:
@@ -366,10 +652,10 @@ def _parse_money_range(value: Any) -> Tuple[Optional[int], Optional[int]]:
         return None, None
 
     # Normalize dash variants
-    s_norm = re.sub(r"[–—]", "-", s)
+    s_norm = _RE_DASH_VARIANTS.sub("-", s)
     # Split on a dash that is likely a range separator
     if "-" in s_norm:
-        parts = [p.strip() for p in s_norm.split("-") if p.strip()]
+        parts = [t for p in s_norm.split("-") if (t := p.strip())]
         if len(parts) >= 2:
             a = _parse_money(parts[0])
             b = _parse_money(parts[1])
@@ -389,7 +675,10 @@ def _clamp_1_5(v: float) -> int:
 
 def _clamp_2_5(v: float) -> int:
     """Keep ratings realistic (avoid 1/5 unless explicitly needed)."""
-    return max(2, min(5, int(round(v))))
+    if type(v) is not int:
+        # Score assembly is integer-only; only float inputs need rounding.
+        v = int(round(v))
+    return 2 if v < 2 else (5 if v > 5 else v)
 
 
 def _percentile_rank(values: List[float], v: float) -> float:
@@ -401,24 +690,20 @@ def _percentile_rank(values: List[float], v: float) -> float:
     """
     if not values:
         return 0.5
-    vals = sorted(float(x) for x in values)
+    return _percentile_rank_sorted(sorted(float(x) for x in values), v)
 
-    # Mid-rank percentile (reduces tie inflation to 1.0).
-    lt = 0
-    eq = 0
-    for x in vals:
-        if x < v:
-            lt += 1
-        elif x == v:
-            eq += 1
-        else:
-            break
 
-    n = float(len(vals))
+def _percentile_rank_sorted(sorted_vals: List[float], v: float) -> float:
+    """Same as _percentile_rank, for a distribution that is already sorted ascending."""
+    n = len(sorted_vals)
     if n <= 0:
         return 0.5
 
-    p = (lt + 0.5 * eq) / n
+    # Mid-rank percentile (reduces tie inflation to 1.0).
+    lt = bisect_left(sorted_vals, v)
+    eq = bisect_right(sorted_vals, v, lt) - lt
+
+    p = (lt + 0.5 * eq) / float(n)
     return max(0.0, min(1.0, p))
 
 
@@ -428,43 +713,66 @@ def _norm_minmax(value: float, mn: float, mx: float) -> float:
     return (value - mn) / (mx - mn)
 
 
-def _load_microhood_commune_map() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def _load_microhood_commune_map() -> Mapping[str, str]:
     """Map microhood name variants -> commune_en using monitoring_quartiers_full.geojson.
 
     This is used as a validator so we never recommend microhoods outside the selected commune.
+    The geojson is static per deploy, so the map is parsed once and returned read-only
+    (call ``_load_microhood_commune_map.cache_clear()`` after swapping the file).
     """
     geo_path = Path(__file__).resolve().parent.parent / "city_packs" / "monitoring_quartiers_full.geojson"
     if not geo_path.exists():
-        return {}
-    try:
-        data = json.loads(geo_path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+        return MappingProxyType({})
 
     out: Dict[str, str] = {}
-    for feat in data.get("features", []) or []:
-        props = feat.get("properties") or {}
-        commune = _as_str(props.get("commune_en"))
-        if not commune:
-            continue
-        for k in ["name_fr", "name_nl", "name_bil"]:
-            nm = _as_str(props.get(k))
-            if not nm:
+    try:
+        for feat in _iter_geojson_features(geo_path):
+            props = feat.get("properties") or {}
+            commune = _as_str(props.get("commune_en"))
+            if not commune:
                 continue
-            out[_norm_label(nm)] = commune
-    return out
+            for k in ["name_fr", "name_nl", "name_bil"]:
+                nm = _as_str(props.get(k))
+                if not nm:
+                    continue
+                out[_norm_label(nm)] = commune
+    except Exception:
+        return MappingProxyType({})
+    return MappingProxyType(out)
+
+
+def _iter_geojson_features(geo_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield geojson features, streaming with ijson when it is installed.
+
+    Streaming keeps only one feature (not the whole parsed file, geometries included)
+    alive at a time; without ijson we fall back to parsing the whole file.
+    """
+    if ijson is not None:
+        with geo_path.open("rb") as fp:
+            yield from ijson.items(fp, "features.item", use_float=True)
+        return
+    data = _json_loads(geo_path.read_bytes())
+    yield from data.get("features", []) or []
 
 
 def _as_list(x: Any) -> List[str]:
     if x is None:
         return []
     if isinstance(x, list):
-        return [str(i).strip() for i in x if str(i).strip()]
+        # Common case (structured LLM output): every item is already a stripped,
+        # non-empty str, so a plain copy replaces the per-item rebuild.
+        for i in x:
+            if type(i) is not str or not i or i.strip() != i:
+                break
+        else:
+            return x[:]
+        return [s for s in map(str.strip, map(str, x)) if s]
     if isinstance(x, str):
         s = x.strip()
         if not s:
             return []
-        parts = [p.strip("-• \t") for p in re.split(r"[\n,;]+", s) if p.strip()]
+        parts = [p.strip("-• \t") for p in s.translate(_LIST_SEP_TRANSLATE).split(",") if p.strip()]
         return parts if parts else [s]
     return [str(x).strip()]
 
@@ -475,19 +783,28 @@ def _as_str(x: Any) -> str:
     if isinstance(x, str):
         return x.strip()
     if isinstance(x, dict):
+        # Client-facing text: keep the stdlib layout ({"a": 1}, NaN as NaN) rather
+        # than orjson's compact form; this path only fires on a stray model object.
         return json.dumps(x, ensure_ascii=False)
     return str(x).strip()
 
 
 def _trim(lst: List[str], n: int) -> List[str]:
-    return lst[:n] if n and n > 0 else lst
+    """Cap *lst* at *n* items, returning it as-is when already short enough.
+
+    Callers pass fresh lists (from _as_list), so no defensive copy is needed.
+    Strings need no such helper: ``s[:n]`` already returns ``s`` when it fits.
+    """
+    return lst[:n] if n and n > 0 and len(lst) > n else lst
 
 
 def _score_obj(x: Any) -> Dict[str, int]:
-    keys = ["Safety", "Family", "Commute", "Lifestyle", "BudgetFit", "Overall"]
+    # Structured output usually carries all six keys as in-range ints already.
+    if isinstance(x, dict) and all(type(x.get(k)) is int and 1 <= x[k] <= 5 for k in ALL_SCORE_KEYS):
+        return {k: x[k] for k in ALL_SCORE_KEYS}
     s: Dict[str, int] = {}
     if isinstance(x, dict):
-        for k in keys:
+        for k in ALL_SCORE_KEYS:
             v = x.get(k) if k in x else x.get(k.lower())
             if v is None:
                 continue
@@ -495,13 +812,33 @@ def _score_obj(x: Any) -> Dict[str, int]:
                 s[k] = max(1, min(5, int(v)))
             except Exception:
                 pass
-    # defaults
-    for k in ["Safety", "Family", "Commute", "Lifestyle", "BudgetFit"]:
-        s.setdefault(k, 3)
-    if "Overall" not in s:
-        base = [s[k] for k in ["Safety", "Family", "Commute", "Lifestyle", "BudgetFit"]]
-        s["Overall"] = int(round(sum(base) / len(base)))
-    return s
+    # defaults, laid out in ALL_SCORE_KEYS order like the fast path above
+    out = {k: s.get(k, 3) for k in SCORE_KEYS}
+    # Five clamped ints: integer form of round(mean), no temporary list.
+    out["Overall"] = s["Overall"] if "Overall" in s else (sum(out.values()) + 2) // 5
+    return out
+
+
+def _link_key(it: Any) -> Tuple[Any, ...]:
+    """Hashable stand-in for one raw link item (see _norm_links)."""
+    if isinstance(it, str):
+        return ("str", it)
+    if isinstance(it, dict):
+        return ("dict", it.get("name", "—"), it.get("url", ""), it.get("note", ""))
+    return ("other", it)
+
+
+@lru_cache(maxsize=256)
+def _norm_links_cached(keys: Tuple[Tuple[Any, ...], ...]) -> Tuple[Tuple[str, str, str], ...]:
+    out: List[Tuple[str, str, str]] = []
+    for k in keys:
+        if k[0] == "str":
+            out.append((k[1].strip() or "—", "", ""))
+        elif k[0] == "dict":
+            out.append((_as_str(k[1]) or "—", _as_str(k[2]), _as_str(k[3])))
+        else:
+            out.append((_as_str(k[1]) or "—", "", ""))
+    return tuple(out)
 
 
 def _norm_links(items: Any) -> List[Dict[str, str]]:
@@ -511,49 +848,108 @@ def _norm_links(items: Any) -> List[Dict[str, str]]:
         items = [items]
     if isinstance(items, str):
         items = _as_list(items)
-    out: List[Dict[str, str]] = []
-    for it in items:
-        if isinstance(it, str):
-            out.append({"name": it.strip() or "—", "url": "", "note": ""})
-        elif isinstance(it, dict):
-            out.append(
-                {
-                    "name": _as_str(it.get("name", "—")) or "—",
-                    "url": _as_str(it.get("url", "")),
-                    "note": _as_str(it.get("note", "")),
-                }
-            )
+    if isinstance(items, list):
+        # City-pack links are already canonical (stripped name/url/note strings):
+        # copy them straight into fresh rows, skipping key building and the cache.
+        rows_fast: List[Dict[str, str]] = []
+        for it in items:
+            if not isinstance(it, dict):
+                break
+            n, u, t = it.get("name"), it.get("url"), it.get("note")
+            if not (type(n) is str and n and n.strip() == n):
+                break
+            if not (type(u) is str and u.strip() == u and type(t) is str and t.strip() == t):
+                break
+            rows_fast.append({"name": n, "url": u, "note": t})
         else:
-            out.append({"name": _as_str(it) or "—", "url": "", "note": ""})
+            return rows_fast
+    keys = tuple(_link_key(it) for it in items)
+    if all(type(v) is str for k in keys for v in k[1:]):
+        rows = _norm_links_cached(keys)
+    else:
+        # Only all-string payloads are cached: 5, 5.0 and True would share a key
+        # while rendering differently, and nested values aren't hashable.
+        rows = _norm_links_cached.__wrapped__(keys)
+    # Fresh dicts per call so callers can't mutate cached rows.
+    return [{"name": n, "url": u, "note": t} for n, u, t in rows]
+
+
+def _slice(d: Dict[str, Any], key: str, n: int) -> List[Any]:
+    """``(d.get(key) or [])[:n]`` without allocating the fallback list."""
+    try:
+        v = d[key]
+    except KeyError:
+        return []
+    return v[:n] if v else []
+
+
+def _first_names(items: Any, n: int = 3) -> List[str]:
+    """First *n* non-empty ``name`` values from the dicts in *items*; other items are skipped.
+
+    Stops as soon as *n* names are collected instead of filtering the whole list.
+    """
+    out: List[str] = []
+    for it in items or ():
+        if not isinstance(it, dict):
+            continue
+        nm = it.get("name")
+        if nm:
+            out.append(nm)
+            if len(out) >= n:
+                break
     return out
 
 
+def _first_strs(items: Any, n: int = 3) -> List[str]:
+    """First *n* non-empty ``_as_str`` values from *items*, with the same early exit."""
+    out: List[str] = []
+    for it in items or ():
+        t = _as_str(it)
+        if t:
+            out.append(t)
+            if len(out) >= n:
+                break
+    return out
+
+
+@lru_cache(maxsize=4096)
 def _norm_label(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip().lower())
+    s = s or ""
+    if not s.isascii():
+        s = unicodedata.normalize("NFC", s)
+    s = s.strip().casefold()
+    # Printable text has no whitespace besides " ", so without a double space
+    # there is no run to collapse (same guard as _normalize_dashes).
+    if "  " not in s and s.isprintable():
+        return s
+    return _RE_WS.sub(" ", s)
 
 
 def _split_csv(value: str) -> List[str]:
     if not value:
         return []
-    return [v.strip() for v in str(value).split(",") if v.strip()]
+    return [t for v in str(value).split(",") if (t := v.strip())]
 
 
 def _priority_match(
     commune_tags: List[str],
-    priority_ids: List[str],
-    top3_ids: List[str],
+    priority_ids: Collection[str],
+    top3_ids: Collection[str],
 ) -> Dict[str, List[str]]:
     strong = [t for t in commune_tags if t in top3_ids]
-    medium = [t for t in commune_tags if (t in priority_ids and t not in strong)]
+    # "not in strong" == "not in top3_ids" for a commune tag; test the set, not the list.
+    medium = [t for t in commune_tags if (t in priority_ids and t not in top3_ids)]
     return {"strong": strong[:3], "medium": medium[:4]}
 
 
-def _priority_snapshot(tags: List[str], scores: Dict[str, int], metrics: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+def _priority_snapshot(tags: Collection[str], scores: Dict[str, int], metrics: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    tagset = frozenset(tags or ())
+
     # Cost / budget feel
     bf = int(scores.get("BudgetFit", 3))
-    if "premium_feel" in tags or bf <= 2:
+    if "premium_feel" in tagset or bf <= 2:
         cost = "Higher cost; budget may feel tight in prime streets."
-    elif "value_for_money" in tags or bf >= 4:
+    elif "value_for_money" in tagset or bf >= 4:
         cost = "Better value vs central premium areas; more space for the budget."
     else:
         cost = "Mid-range pricing; specific streets vary a lot."
@@ -564,27 +960,27 @@ def _priority_snapshot(tags: List[str], scores: Dict[str, int], metrics: Optiona
     tram_d = float((metrics or {}).get("tram_density") or 0)
     train_d = float((metrics or {}).get("train_density") or 0)
     transit_bits = []
-    if metro_d >= 0.6 or "metro_strong" in tags:
+    if metro_d >= 0.6 or "metro_strong" in tagset:
         transit_bits.append("metro access")
-    if tram_d >= 2.5 or "tram_strong" in tags:
+    if tram_d >= 2.5 or "tram_strong" in tagset:
         transit_bits.append("tram coverage")
-    if train_d >= 0.2 or "train_hubs_access" in tags:
+    if train_d >= 0.2 or "train_hubs_access" in tagset:
         transit_bits.append("near train links")
     transit = ", ".join(transit_bits) if transit_bits else "bus-based; verify nearest stops"
 
     # Commute / access
     access_bits = []
-    if "central_access" in tags:
+    if "central_access" in tagset:
         access_bits.append("city center")
-    if "eu_quarter_access" in tags:
+    if "eu_quarter_access" in tagset:
         access_bits.append("EU quarter")
-    if "airport_access" in tags:
+    if "airport_access" in tagset:
         access_bits.append("airport")
     commute_access = ", ".join(access_bits) if access_bits else "depends on address; check travel times"
 
     # Family
     parks_share = float((metrics or {}).get("parks_share") or 0)
-    if any(t in tags for t in ["families", "schools_strong", "childcare_strong", "green_parks"]) or parks_share >= 0.12:
+    if not tagset.isdisjoint(("families", "schools_strong", "childcare_strong", "green_parks")) or parks_share >= 0.12:
         schools_family = "generally family-friendly; parks/schools are a key advantage"
     else:
         schools_family = "varies by pocket; check schools/childcare options nearby"
@@ -632,7 +1028,7 @@ def _microhood_sentence_from_metrics(mh: Dict[str, Any]) -> Tuple[str, str]:
 
 
 def _derive_strengths_tradeoffs(
-    tags: List[str],
+    tags: Collection[str],
     snapshot: Dict[str, str],
     *,
     anchors: List[str],
@@ -648,20 +1044,21 @@ def _derive_strengths_tradeoffs(
     tradeoffs: List[str] = []
 
     scores = scores or {}
+    tagset = frozenset(tags or ())
 
     # Strengths (tag-driven)
-    if "expats_international" in tags:
+    if "expats_international" in tagset:
         strengths.append("Strong international / expat ecosystem and services.")
-    if "eu_quarter_access" in tags:
+    if "eu_quarter_access" in tagset:
         strengths.append("Very convenient access to the EU Quarter and central corridors.")
-    if "green_parks" in tags or "families" in tags or "residential_quiet" in tags:
-        if "green_parks" in tags:
+    if "green_parks" in tagset or "families" in tagset or "residential_quiet" in tagset:
+        if "green_parks" in tagset:
             strengths.append(f"Stronger green pockets around {anchor_hint} (parks and calmer streets).")
         else:
             strengths.append(f"Calmer, more residential pockets around {anchor_hint} compared with busier hubs.")
-    if "cafes_brunch" in tags or "restaurants" in tags:
+    if "cafes_brunch" in tagset or "restaurants" in tagset:
         strengths.append("Plenty of day-to-day amenities (cafés, restaurants) within walking distance.")
-    if "metro_strong" in tags or "tram_strong" in tags:
+    if "metro_strong" in tagset or "tram_strong" in tagset:
         strengths.append("Reliable public transport coverage for everyday commuting.")
 
     # Score-derived (commune-specific, helps avoid copy/paste text)
@@ -692,16 +1089,16 @@ def _derive_strengths_tradeoffs(
         strengths.append(f"Good access to {snapshot['commute_access']} from {anchor_hint}.")
 
     # Trade-offs
-    if "busy_traffic_noise" in tags:
+    if "busy_traffic_noise" in tagset:
         tradeoffs.append("Traffic/noise can be noticeable on main arteries; shortlist street-by-street.")
-    if "nightlife" in tags or "night_caution" in tags:
+    if "nightlife" in tagset or "night_caution" in tagset:
         tradeoffs.append("Busier evenings in hotspots; confirm noise levels during a late walk-through.")
-    if "premium_feel" in tags or int(scores.get("BudgetFit", 3)) <= 2:
+    if "premium_feel" in tagset or int(scores.get("BudgetFit", 3)) <= 2:
         if tenure == "rent":
             tradeoffs.append("Prime pockets can be pricey; validate the full monthly cost (rent + charges + utilities).")
         else:
             tradeoffs.append("Prime pockets can be pricey; validate the full purchase cost (price + fees + recurring charges).")
-    if "car_friendly" not in tags and "parking_tight" in tags:
+    if "car_friendly" not in tagset and "parking_tight" in tagset:
         tradeoffs.append("Parking can be challenging without a private spot; verify permits early.")
     if snapshot.get("housing_cost"):
         tradeoffs.append(snapshot["housing_cost"].replace("Typical housing cost", ""))
@@ -728,6 +1125,18 @@ def _derive_strengths_tradeoffs(
     return strengths, tradeoffs
 
 
+def _alt_pair(text: str) -> Tuple[str, str]:
+    return (_norm_label(text), text)
+
+
+# Fixed alternative sentences for _uniqueize_shortlist_copy, keyed once at import.
+_ALT_STRENGTH_CALM = _alt_pair("Generally calmer residential feel compared with central nightlife hubs.")
+_ALT_STRENGTH_PRIME = _alt_pair("Prime pockets can be competitive; widen the search radius within the commune to keep options.")
+_ALT_TRADE_COMPETITION = _alt_pair("Competition can be high in prime pockets; be ready to move quickly on good listings.")
+_ALT_TRADE_COMMUTE = _alt_pair("Commute convenience varies; test your door-to-door route at peak hours before committing.")
+_ALT_TRADE_CHECKS = _alt_pair("Check building charges (syndic), EPC, and noise insulation — these vary street-by-street.")
+
+
 def _uniqueize_shortlist_copy(
     districts: List[Dict[str, Any]],
     *,
@@ -742,26 +1151,26 @@ def _uniqueize_shortlist_copy(
     answers = answers or {}
 
     # Rank districts by key dimensions so we can write "best for X" lines without inventing facts.
-    dims = ["Family", "Commute", "Lifestyle", "BudgetFit", "Safety"]
-    scores_by_dim: Dict[str, List[int]] = {d: [] for d in dims}
-    for d in districts:
-        sc = d.get("scores") or {}
-        for dim in dims:
-            try:
-                scores_by_dim[dim].append(int(sc.get(dim, 0)))
-            except Exception:
-                scores_by_dim[dim].append(0)
-
-    # Helper: rank index (0 = best)
-    def _rank_indices(vals: List[int]) -> List[int]:
-        # Higher is better. Stable tie-break by original order.
-        order = sorted(range(len(vals)), key=lambda i: (-vals[i], i))
-        rank = [0] * len(vals)
-        for r, i in enumerate(order):
-            rank[i] = r
-        return rank
+    vecs = [ScoreVec.from_scores(d.get("scores")) for d in districts]
+    # The copy rules read raw scores with int(); a district whose scores don't all
+    # parse (e.g. None scores without a city pack) keeps its copy as it is.
+    numeric = [_scores_parse_as_ints(d.get("scores")) for d in districts]
+    scores_by_dim: Dict[str, List[int]] = {
+        "Family": [v.family for v in vecs],
+        "Commute": [v.commute for v in vecs],
+        "Lifestyle": [v.lifestyle for v in vecs],
+        "BudgetFit": [v.budget_fit for v in vecs],
+        "Safety": [v.safety for v in vecs],
+    }
 
-    ranks = {dim: _rank_indices(scores_by_dim[dim]) for dim in dims}
+    # Only "who is #1 on this dimension" is ever consulted, so take the leader per
+    # dimension in one pass. max() keeps the first maximum, i.e. ties go to the
+    # earlier district (same as a stable descending sort).
+    leader = {
+        dim: max(range(len(vals)), key=vals.__getitem__)
+        for dim, vals in scores_by_dim.items()
+        if vals
+    }
 
     commute_to = _as_str(
         answers.get("commute_to") or answers.get("commute_destination") or answers.get("work_location") or ""
@@ -771,23 +1180,46 @@ def _uniqueize_shortlist_copy(
     used_strength_keys: set[str] = set()
     used_tradeoff_keys: set[str] = set()
 
+    # De-dupe across districts by replacing duplicates with specific alternatives.
+    # Alternatives come in as precomputed (norm_key, text) pairs (see _ALT_*).
+    def _push_unique(items: List[str], used: set[str], alts: List[Tuple[str, str]]) -> List[str]:
+        out: List[str] = []
+        for x in items:
+            k = _norm_label(x)
+            if k in used:
+                continue
+            used.add(k)
+            out.append(x)
+        # Fill up to original length (max 4/3) with alternatives that are not yet used.
+        for k, a in alts:
+            if len(out) >= len(items):
+                break
+            if k in used:
+                continue
+            used.add(k)
+            out.append(a)
+        return out
+
     for i, d in enumerate(districts):
+        if not numeric[i]:
+            continue
+
         anchors = d.get("micro_anchors") or d.get("anchors") or []
         anchor_hint = anchors[0] if anchors else d.get("name") or "key hubs"
-        sc = d.get("scores") or {}
+        sv = vecs[i]
 
         # Candidate first-strength lines (ordered by what usually sells best for families).
         cand: List[str] = []
-        if ranks.get("Family", [99])[i] == 0 and int(sc.get("Family", 0)) >= 4:
+        if leader.get("Family") == i and sv.family >= 4:
             cand.append(f"Best family fit in the shortlist: calmer pockets near {anchor_hint} and good parks/schools access.")
-        if ranks.get("Commute", [99])[i] == 0 and int(sc.get("Commute", 0)) >= 4:
+        if leader.get("Commute") == i and sv.commute >= 4:
             if commute_to:
                 cand.append(f"Strongest commute option: often the easiest access to {commute_to} from around {anchor_hint}.")
             else:
                 cand.append(f"Strongest commute option: above-average connectivity around {anchor_hint} via metro/tram corridors.")
-        if ranks.get("Lifestyle", [99])[i] == 0 and int(sc.get("Lifestyle", 0)) >= 4:
+        if leader.get("Lifestyle") == i and sv.lifestyle >= 4:
             cand.append(f"Most lifestyle-dense option: cafés/amenities cluster more strongly around {anchor_hint}.")
-        if ranks.get("BudgetFit", [99])[i] == 0 and int(sc.get("BudgetFit", 0)) >= 4:
+        if leader.get("BudgetFit") == i and sv.budget_fit >= 4:
             cand.append(f"Best value fit: more options within budget compared with the other shortlisted communes.")
         if not cand:
             # Fallback that still reads specific
@@ -804,42 +1236,22 @@ def _uniqueize_shortlist_copy(
         else:
             strengths = [cand[0]]
 
-        # De-dupe across districts by replacing duplicates with specific alternatives.
-        def _push_unique(items: List[str], used: set[str], alts: List[str]) -> List[str]:
-            out: List[str] = []
-            for x in items:
-                k = _norm_label(x)
-                if k in used:
-                    continue
-                used.add(k)
-                out.append(x)
-            # Fill up to original length (max 4/3) with alternatives that are not yet used.
-            for a in alts:
-                if len(out) >= len(items):
-                    break
-                k = _norm_label(a)
-                if k in used:
-                    continue
-                used.add(k)
-                out.append(a)
-            return out
-
         # Strength alternatives to reduce templating feel
-        alt_strengths: List[str] = []
-        if int(sc.get("Safety", 0)) >= 4:
-            alt_strengths.append("Generally calmer residential feel compared with central nightlife hubs.")
-        if int(sc.get("BudgetFit", 0)) <= 2:
-            alt_strengths.append("Prime pockets can be competitive; widen the search radius within the commune to keep options.")
+        alt_strengths: List[Tuple[str, str]] = []
+        if sv.safety >= 4:
+            alt_strengths.append(_ALT_STRENGTH_CALM)
+        if sv.budget_fit <= 2:
+            alt_strengths.append(_ALT_STRENGTH_PRIME)
 
         strengths = _push_unique(strengths, used_strength_keys, alt_strengths)[:4]
 
         # Trade-off alternatives
-        alt_trade: List[str] = []
-        if int(sc.get("BudgetFit", 0)) <= 2:
-            alt_trade.append("Competition can be high in prime pockets; be ready to move quickly on good listings.")
-        if int(sc.get("Commute", 0)) <= 2:
-            alt_trade.append("Commute convenience varies; test your door-to-door route at peak hours before committing.")
-        alt_trade.append("Check building charges (syndic), EPC, and noise insulation — these vary street-by-street.")
+        alt_trade: List[Tuple[str, str]] = []
+        if sv.budget_fit <= 2:
+            alt_trade.append(_ALT_TRADE_COMPETITION)
+        if sv.commute <= 2:
+            alt_trade.append(_ALT_TRADE_COMMUTE)
+        alt_trade.append(_ALT_TRADE_CHECKS)
 
         tradeoffs = _push_unique(tradeoffs, used_tradeoff_keys, alt_trade)[:3]
 
@@ -850,59 +1262,141 @@ def _uniqueize_shortlist_copy(
 
 
 
+# Raw (pre-percentile) axis formulas as (metric, weight) columns.
+RAW_AXIS_WEIGHTS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    "lifestyle": (("cafes_density", 1.0), ("restaurants_density", 0.6), ("bars_density", 0.8)),
+    "commute": (("metro_density", 3.0), ("tram_density", 1.0), ("train_density", 2.0)),
+    "family": (("schools_density", 1.2), ("childcare_density", 2.0), ("parks_share", 18.0)),
+}
+
+
+# Raw safety = base + per-tag-group adjustments, applied in this order.
+RAW_SAFETY_BASE = 4.0
+RAW_SAFETY_TAG_ADJUSTMENTS: Tuple[Tuple[FrozenSet[str], float], ...] = (
+    (frozenset({"night_caution"}), -0.7),
+    (frozenset({"nightlife"}), -0.3),
+    (frozenset({"older_quiet", "residential_quiet"}), 0.4),
+    (frozenset({"busy_traffic_noise"}), -0.2),
+)
+
+
+def _weighted_metric_sum(metrics: Dict[str, Any], weights: Tuple[Tuple[str, float], ...]) -> float:
+    total = 0.0
+    for key, w in weights:
+        total += w * float(metrics.get(key) or 0)
+    return total
+
+
 def _build_commune_score_index(pack: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, float]], Dict[str, List[float]]]:
-    """Precompute raw feature scores and distributions for scaling across communes.
+    """Precompute raw feature scores and (sorted) distributions for scaling across communes.
 
     We keep the scoring deterministic and *relative* (percentile-based) so
     communes don't all collapse to the same 5/5 ratings.
     """
     communes = pack.get("communes") or []
-    rows = []
-    for c in communes:
-        m = c.get("metrics") or {}
-        tags = c.get("tags") or []
-        lifestyle = float(m.get("cafes_density") or 0) + 0.6 * float(m.get("restaurants_density") or 0) + 0.8 * float(m.get("bars_density") or 0)
-        commute = 3.0 * float(m.get("metro_density") or 0) + 1.0 * float(m.get("tram_density") or 0) + 2.0 * float(m.get("train_density") or 0)
-        family = 1.2 * float(m.get("schools_density") or 0) + 2.0 * float(m.get("childcare_density") or 0) + 18.0 * float(m.get("parks_share") or 0)
-        safety = 4.0
-        if "night_caution" in tags:
-            safety -= 0.7
-        if "nightlife" in tags:
-            safety -= 0.3
-        if "older_quiet" in tags or "residential_quiet" in tags:
-            safety += 0.4
-        if "busy_traffic_noise" in tags:
-            safety -= 0.2
-        rows.append((c.get("name"), {"lifestyle": lifestyle, "commute": commute, "family": family, "safety": safety}))
-
-    dists = {
-        "lifestyle": [r[1]["lifestyle"] for r in rows if r[0]],
-        "commute": [r[1]["commute"] for r in rows if r[0]],
-        "family": [r[1]["family"] for r in rows if r[0]],
-        "safety": [r[1]["safety"] for r in rows if r[0]],
-    }
-
+    dists: Dict[str, List[float]] = {"lifestyle": [], "commute": [], "family": [], "safety": []}
     idx: Dict[str, Dict[str, float]] = {}
-    for name, raw in rows:
+    # Single pass: score each named commune and feed the distributions as we go.
+    for c in communes:
+        name = c.get("name")
         if not name:
             continue
-        idx[name] = {
-            "lifestyle": float(raw["lifestyle"]),
-            "commute": float(raw["commute"]),
-            "family": float(raw["family"]),
-            "safety": float(raw["safety"]),
-        }
+        m = c.get("metrics") or {}
+        tagset = frozenset(c.get("tags") or ())
+        raw = {axis: _weighted_metric_sum(m, weights) for axis, weights in RAW_AXIS_WEIGHTS.items()}
+        safety = RAW_SAFETY_BASE
+        for group, delta in RAW_SAFETY_TAG_ADJUSTMENTS:
+            if not tagset.isdisjoint(group):
+                safety += delta
+        raw["safety"] = safety
+        for axis, vals in dists.items():
+            vals.append(raw[axis])
+        idx[name] = raw
+
+    # Distributions are pre-sorted so percentile lookups can bisect.
+    for vals in dists.values():
+        vals.sort()
     return idx, dists
 
 
+class ParsedAnswers(NamedTuple):
+    """Answer fields every per-commune helper needs, parsed once per brief."""
+
+    rent_lo: Optional[int]
+    rent_hi: Optional[int]
+    buy_lo: Optional[int]
+    buy_hi: Optional[int]
+    is_buy: bool
+    is_family_household: bool
+
+    @property
+    def tenure(self) -> str:
+        return "buy" if self.is_buy else "rent"
+
+    @classmethod
+    def from_answers(cls, answers: Optional[Dict[str, Any]]) -> "ParsedAnswers":
+        answers = answers or {}
+        rent_lo, rent_hi = _parse_money_range(answers.get("budget_rent"))
+        buy_lo, buy_hi = _parse_money_range(answers.get("budget_buy"))
+        is_buy = bool(buy_hi or ("buy" in _as_str(answers.get("housing_type")).lower()))
+
+        h_txt = str(answers.get("household") or answers.get("household_type") or answers.get("family") or "").lower()
+        kids_raw = answers.get("children_count", answers.get("kids_count", answers.get("children", answers.get("kids", 0))))
+        try:
+            kids_n = int(kids_raw) if str(kids_raw).strip() else 0
+        except Exception:
+            kids_n = 0
+        is_family_household = ("family" in h_txt) or (kids_n > 0)
+        return cls(rent_lo, rent_hi, buy_lo, buy_hi, is_buy, is_family_household)
+
+
+# Cost-pressure bands (percentile < .55 / < .8 / above): BudgetFit penalty 0..2
+# and the matching wording in the budget reality line.
+_PRESSURE_CUTS = (0.55, 0.8)
+_PRESSURE_TXT = ("more options", "moderate competition", "tighter supply")
+
+_BUDGET_FIT_TXT: Dict[int, str] = {
+    5: "very comfortable",
+    4: "generally workable",
+    3: "workable with trade-offs",
+    2: "likely tight",
+    1: "very tight",
+}
+
+
+def _pressure_band(pressure_p: float) -> int:
+    return bisect_right(_PRESSURE_CUTS, pressure_p)
+
+
+def _pressure_raw(raw: Dict[str, float]) -> float:
+    """Commune cost-pressure proxy: lifestyle + 0.8 * commute raw index."""
+    return float(raw.get("lifestyle", 0.0)) + 0.8 * float(raw.get("commute", 0.0))
+
+
+# id(score_index) -> (score_index, sorted pressure distribution); see identity_cache.
+_PRESSURE_DIST_CACHE: Dict[int, Tuple[Dict[str, Dict[str, float]], List[float]]] = {}
+_PRESSURE_DIST_CACHE_MAX = 8
+
+
+def _pressure_dist_sorted(score_index: Dict[str, Dict[str, float]]) -> List[float]:
+    """Sorted pressure distribution across the pack, built once per score index."""
+    return identity_cache(
+        _PRESSURE_DIST_CACHE,
+        _PRESSURE_DIST_CACHE_MAX,
+        score_index,
+        lambda: sorted(_pressure_raw(r) for r in score_index.values()),
+    )
+
+
 def _compute_budget_fit(
-    tags: List[str],
+    tags: Collection[str],
     *,
     answers: Optional[Dict[str, Any]] = None,
     commune: Optional[Dict[str, Any]] = None,
     score_index: Optional[Dict[str, Dict[str, float]]] = None,
     score_dists: Optional[Dict[str, List[float]]] = None,
     return_debug: bool = False,
+    parsed: Optional[ParsedAnswers] = None,
 ) -> Any:
     """Budget fit heuristic (2-5) based on budget *and* commune cost pressure.
 
@@ -911,9 +1405,8 @@ def _compute_budget_fit(
     densities (lifestyle + commute). This creates realistic variation between
     communes and prevents identical BudgetFit everywhere.
     """
-    answers = answers or {}
-    rent_lo, rent_hi = _parse_money_range(answers.get("budget_rent"))
-    buy_lo, buy_hi = _parse_money_range(answers.get("budget_buy"))
+    pa = parsed or ParsedAnswers.from_answers(answers)
+    rent_hi, buy_hi = pa.rent_hi, pa.buy_hi
 
     # Use the *upper* end as what the client can realistically spend.
     rent = rent_hi
@@ -930,12 +1423,10 @@ def _compute_budget_fit(
     if commune and score_index and score_dists:
         name = commune.get("name")
         base = score_index.get(name or "", {})
-        pressure_raw = float(base.get("lifestyle", 0.0)) + 0.8 * float(base.get("commute", 0.0))
-        dist = [float(r.get("lifestyle", 0.0)) + 0.8 * float(r.get("commute", 0.0)) for r in score_index.values()]
-        pressure_p = _percentile_rank(dist, pressure_raw)
+        pressure_p = _percentile_rank_sorted(_pressure_dist_sorted(score_index), _pressure_raw(base))
 
     # Convert pressure percentile to an integer penalty (0..2)
-    pressure_pen = 2 if pressure_p >= 0.8 else (1 if pressure_p >= 0.55 else 0)
+    pressure_pen = _pressure_band(pressure_p)
 
     debug = {
         "rent_hi": rent_hi,
@@ -973,6 +1464,7 @@ def _compute_budget_fit(
     return (3, {"reason": "fallback"}) if return_debug else 3
 
 
+@lru_cache(maxsize=256)
 def _fmt_eur_range(lo: Optional[int], hi: Optional[int], *, per_month: bool = False) -> str:
     if lo and hi and lo != hi:
         core = f"€{lo:,}–€{hi:,}"
@@ -986,22 +1478,22 @@ def _fmt_eur_range(lo: Optional[int], hi: Optional[int], *, per_month: bool = Fa
 
 
 def _budget_reality_check(
-    tags: List[str],
+    tags: Collection[str],
     scores: Dict[str, int],
     *,
     answers: Optional[Dict[str, Any]] = None,
     commune: Optional[Dict[str, Any]] = None,
     score_index: Optional[Dict[str, Dict[str, float]]] = None,
     score_dists: Optional[Dict[str, List[float]]] = None,
+    parsed: Optional[ParsedAnswers] = None,
 ) -> str:
     """Generate an honest, non-numeric 'what you can expect' budget line.
 
     We avoid pretending we have market pricing data. Instead we provide a
     rule-of-thumb framing (bedroom range) and highlight uncertainty.
     """
-    answers = answers or {}
-    rent_lo, rent_hi = _parse_money_range(answers.get("budget_rent"))
-    buy_lo, buy_hi = _parse_money_range(answers.get("budget_buy"))
+    pa = parsed or ParsedAnswers.from_answers(answers)
+    rent_lo, rent_hi, buy_lo, buy_hi = pa.rent_lo, pa.rent_hi, pa.buy_lo, pa.buy_hi
     budgetfit = int(scores.get("BudgetFit", 3))
 
     # Commune cost pressure (same proxy as in BudgetFit; keeps messages commune-specific
@@ -1010,11 +1502,9 @@ def _budget_reality_check(
     if commune and score_index:
         name = commune.get("name")
         base = score_index.get(name or "", {})
-        pressure_raw = float(base.get("lifestyle", 0.0)) + 0.8 * float(base.get("commute", 0.0))
-        dist = [float(r.get("lifestyle", 0.0)) + 0.8 * float(r.get("commute", 0.0)) for r in score_index.values()]
-        pressure_p = _percentile_rank(dist, pressure_raw)
+        pressure_p = _percentile_rank_sorted(_pressure_dist_sorted(score_index), _pressure_raw(base))
 
-    pressure_txt = "more options" if pressure_p < 0.55 else ("moderate competition" if pressure_p < 0.8 else "tighter supply")
+    pressure_txt = _PRESSURE_TXT[_pressure_band(pressure_p)]
 
     if buy_hi:
         # Conservative, non-binding heuristic for BE apartments / townhouses
@@ -1028,13 +1518,7 @@ def _budget_reality_check(
         else:
             target = "studio–1BR; consider compromises on size or location"
 
-        fit_txt = {
-            5: "very comfortable",
-            4: "generally workable",
-            3: "workable with trade-offs",
-            2: "likely tight",
-            1: "very tight",
-        }.get(budgetfit, "workable")
+        fit_txt = _BUDGET_FIT_TXT.get(budgetfit, "workable")
 
         amt = _fmt_eur_range(buy_lo, buy_hi)
         return (
@@ -1053,13 +1537,7 @@ def _budget_reality_check(
         else:
             target = "studio-focused; consider widening the search"
 
-        fit_txt = {
-            5: "very comfortable",
-            4: "generally workable",
-            3: "workable with trade-offs",
-            2: "likely tight",
-            1: "very tight",
-        }.get(budgetfit, "workable")
+        fit_txt = _BUDGET_FIT_TXT.get(budgetfit, "workable")
 
         amt = _fmt_eur_range(rent_lo, rent_hi, per_month=True)
         return (
@@ -1073,6 +1551,65 @@ def _budget_reality_check(
     return "Budget reality depends on the exact street and building condition; confirm total monthly cost early."
 
 
+def _compute_district_extras(
+    tags: Collection[str],
+    scores: Dict[str, int],
+    commune: Dict[str, Any],
+    *,
+    anchors: List[str],
+    tenure: str = "buy",
+    answers: Optional[Dict[str, Any]] = None,
+    score_index: Optional[Dict[str, Dict[str, float]]] = None,
+    parsed: Optional[ParsedAnswers] = None,
+) -> Dict[str, Any]:
+    """Snapshot, budget line and strengths/trade-offs for one district entry.
+
+    Only the frozen tag set is built once and shared by the three helpers. The
+    priority snapshot is computed from the commune's metrics, while strengths and
+    trade-offs still read the pack's own ``commune["snapshot"]``, as before.
+    """
+    tagset = frozenset(tags or ())
+    snapshot = _priority_snapshot(tagset, scores, metrics=commune.get("metrics") or {})
+    budget_reality = _budget_reality_check(
+        tags=tagset,
+        scores=scores,
+        answers=answers,
+        commune=commune,
+        score_index=score_index,
+        parsed=parsed,
+    )
+    strengths, tradeoffs = _derive_strengths_tradeoffs(
+        tags=tagset,
+        snapshot=commune.get("snapshot", {}) or {},
+        anchors=anchors,
+        scores=scores,
+        tenure=tenure,
+    )
+    return {
+        "snapshot": snapshot,
+        "budget_reality": budget_reality,
+        "strengths": strengths,
+        "tradeoffs": tradeoffs,
+    }
+
+
+# Percentile bin edges for the 2..5 score scale: [0, .25) -> 2, [.25, .55) -> 3, ...
+_PERCENTILE_SCORE_CUTS = (0.25, 0.55, 0.8)
+
+
+# Tag groups that nudge the per-commune 2..5 scores (see _compute_scores_for_commune).
+_SAFETY_BONUS_TAGS = frozenset({"older_quiet", "residential_quiet"})
+_SAFETY_PENALTY_TAGS = frozenset({"night_caution", "nightlife", "busy_traffic_noise"})
+_COMMUTE_BONUS_TAGS = frozenset({"metro_strong", "tram_strong", "train_hubs_access"})
+_LIFESTYLE_BONUS_TAGS = frozenset({"cafes_brunch", "restaurants", "culture_museums"})
+_FAMILY_BONUS_TAGS = frozenset({"families", "schools_strong", "childcare_strong", "green_parks"})
+
+
+def _percentile_to_score(p: float) -> int:
+    """Convert percentile to a realistic 2..5 score using bins."""
+    return 2 + bisect_right(_PERCENTILE_SCORE_CUTS, p)
+
+
 def _compute_scores_for_commune(
     commune: Dict[str, Any],
     score_index: Dict[str, Dict[str, float]],
@@ -1080,75 +1617,64 @@ def _compute_scores_for_commune(
     *,
     answers: Optional[Dict[str, Any]] = None,
     return_debug: bool = False,
+    parsed: Optional[ParsedAnswers] = None,
 ) -> Any:
+    pa = parsed or ParsedAnswers.from_answers(answers)
     name = commune.get("name")
-    tags = commune.get("tags") or []
+    tagset = frozenset(commune.get("tags") or ())
     base = score_index.get(name or "", {})
 
     # Percentile-based scaling (relative across communes) to avoid “all 5/5”.
-    s_p = _percentile_rank(score_dists.get("safety", []), float(base.get("safety", 0.0)))
-    f_p = _percentile_rank(score_dists.get("family", []), float(base.get("family", 0.0)))
-    c_p = _percentile_rank(score_dists.get("commute", []), float(base.get("commute", 0.0)))
-    l_p = _percentile_rank(score_dists.get("lifestyle", []), float(base.get("lifestyle", 0.0)))
+    s_p = _percentile_rank_sorted(score_dists.get("safety", []), float(base.get("safety", 0.0)))
+    f_p = _percentile_rank_sorted(score_dists.get("family", []), float(base.get("family", 0.0)))
+    c_p = _percentile_rank_sorted(score_dists.get("commute", []), float(base.get("commute", 0.0)))
+    l_p = _percentile_rank_sorted(score_dists.get("lifestyle", []), float(base.get("lifestyle", 0.0)))
 
     # Small deterministic bonuses/penalties based on tags
-    safety_bonus = 0.4 if any(t in tags for t in ["older_quiet", "residential_quiet"]) else 0.0
-    safety_pen = 0.5 if any(t in tags for t in ["night_caution", "nightlife", "busy_traffic_noise"]) else 0.0
-
-    commute_bonus = 0.3 if any(t in tags for t in ["metro_strong", "tram_strong", "train_hubs_access"]) else 0.0
-    commute_pen = 0.3 if "car_friendly" not in tags and "busy_traffic_noise" in tags else 0.0
+    safety_bonus = 0.4 if not tagset.isdisjoint(_SAFETY_BONUS_TAGS) else 0.0
+    safety_pen = 0.5 if not tagset.isdisjoint(_SAFETY_PENALTY_TAGS) else 0.0
 
-    lifestyle_bonus = 0.2 if any(t in tags for t in ["cafes_brunch", "restaurants", "culture_museums"]) else 0.0
-    family_bonus = 0.3 if any(t in tags for t in ["families", "schools_strong", "childcare_strong", "green_parks"]) else 0.0
+    commute_bonus = 0.3 if not tagset.isdisjoint(_COMMUTE_BONUS_TAGS) else 0.0
+    commute_pen = 0.3 if "car_friendly" not in tagset and "busy_traffic_noise" in tagset else 0.0
 
-    def _p_to_score(p: float) -> int:
-        """Convert percentile to a realistic 2..5 score using bins."""
-        if p < 0.25:
-            return 2
-        if p < 0.55:
-            return 3
-        if p < 0.8:
-            return 4
-        return 5
+    lifestyle_bonus = 0.2 if not tagset.isdisjoint(_LIFESTYLE_BONUS_TAGS) else 0.0
+    family_bonus = 0.3 if not tagset.isdisjoint(_FAMILY_BONUS_TAGS) else 0.0
 
     # Map percentile -> 2..5, then apply tiny deterministic bumps.
     # IMPORTANT: Safety should very rarely be 5/5 for *all* communes (trust issue).
     # We therefore cap Safety at 4/5 unless the commune is in the top safety band.
-    safety = _p_to_score(s_p)
+    safety = _percentile_to_score(s_p)
     if safety_bonus > 0:
         safety += 1
     if safety_pen > 0:
         safety -= 1
-    safety = max(2, min(5, safety))
+    safety = _clamp_2_5(safety)
     if safety >= 5 and s_p < 0.85:
         safety = 4
 
-    family = _clamp_2_5(_p_to_score(f_p) + (1 if family_bonus > 0 else 0))
+    family = _clamp_2_5(_percentile_to_score(f_p) + (1 if family_bonus > 0 else 0))
 
     # If the user's household is explicitly family-oriented, keep the family score conservative-but-plausible.
     # This prevents obvious UX mismatches like "family-friendly area" but Family=3/5 for green, school-heavy communes.
-    h_txt = str(answers.get("household") or answers.get("household_type") or answers.get("family") or "").lower()
-    kids_raw = answers.get("children_count", answers.get("kids_count", answers.get("children", answers.get("kids", 0))))
-    try:
-        kids_n = int(kids_raw) if str(kids_raw).strip() else 0
-    except Exception:
-        kids_n = 0
-    is_family_household = ("family" in h_txt) or (kids_n > 0)
-    if is_family_household and any(t in tags for t in ("families", "schools_strong", "childcare_strong", "green_parks")):
+    if pa.is_family_household and not tagset.isdisjoint(_FAMILY_BONUS_TAGS):
         family = max(family, 4)
-    commute = _clamp_2_5(_p_to_score(c_p) + (1 if commute_bonus > 0 else 0) - (1 if commute_pen > 0 else 0))
-    lifestyle = _clamp_2_5(_p_to_score(l_p) + (1 if lifestyle_bonus > 0 else 0))
+    commute = _clamp_2_5(_percentile_to_score(c_p) + (1 if commute_bonus > 0 else 0) - (1 if commute_pen > 0 else 0))
+    lifestyle = _clamp_2_5(_percentile_to_score(l_p) + (1 if lifestyle_bonus > 0 else 0))
 
-    budget, budget_debug = _compute_budget_fit(
-        tags,
+    budget_res = _compute_budget_fit(
+        tagset,
         answers=answers,
         commune=commune,
         score_index=score_index,
         score_dists=score_dists,
-        return_debug=True,
+        return_debug=return_debug,
+        parsed=pa,
     )
+    budget, budget_debug = budget_res if return_debug else (budget_res, None)
 
-    overall = int(round((safety + family + commute + lifestyle + budget) / 5.0))
+    # Integer form of round(sum / 5): sums of five ints never land on .5, so
+    # banker's rounding never kicks in.
+    overall = (safety + family + commute + lifestyle + budget + 2) // 5
     scores = {
         "Safety": safety,
         "Family": family,
@@ -1184,35 +1710,94 @@ def _compute_scores_for_commune(
     return scores, debug
 
 
+class _PackIndex(NamedTuple):
+    """Pack-derived lookups for _enforce_communes_and_microhoods.
+
+    They depend on the pack alone, so they are built once per brief rather than
+    per commune; the two dict memos are filled lazily.
+    """
+
+    allowed: List[str]
+    allowed_norm: Dict[str, str]
+    commune_by_name: Dict[str, Dict[str, Any]]
+    score_index: Dict[str, Dict[str, float]]
+    score_dists: Dict[str, List[float]]
+    microhood_profiles_norm: Dict[str, Dict[str, Any]]
+    # Per commune: (name, normalized label, distinctive single token or "").
+    commune_label_checks: List[Tuple[str, str, str]]
+    # commune name -> (microhoods_all, microhoods) indexed by normalized label.
+    microhood_indexes: Dict[Any, Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]]
+    # current commune -> alternation of every other commune's label/token.
+    other_commune_res: Dict[str, Optional["re.Pattern[str]"]]
+
+    @classmethod
+    def from_pack(cls, pack: Dict[str, Any]) -> "_PackIndex":
+        communes = pack.get("communes") or []
+        allowed = [c.get("name") for c in communes if c.get("name")]
+        allowed_labels = [(n, _norm_label(n)) for n in allowed]
+        score_index, score_dists = _build_commune_score_index(pack)
+        microhood_profiles = pack.get("microhood_profiles") or {}
+        commune_label_checks: List[Tuple[str, str, str]] = []
+        for c, k in allowed_labels:
+            toks = set(k.split())
+            tok = next(iter(toks)) if len(toks) == 1 else ""
+            commune_label_checks.append((c, k, tok if len(tok) >= 5 else ""))
+        return cls(
+            allowed=allowed,
+            allowed_norm={k: n for n, k in allowed_labels},
+            commune_by_name={c.get("name"): c for c in communes if c.get("name")},
+            score_index=score_index,
+            score_dists=score_dists,
+            microhood_profiles_norm={
+                _norm_label(k): v for k, v in microhood_profiles.items() if isinstance(k, str) and isinstance(v, dict)
+            },
+            commune_label_checks=commune_label_checks,
+            microhood_indexes={},
+            other_commune_res={},
+        )
+
+
 def _enforce_communes_and_microhoods(
     brief: Dict[str, Any],
     pack: Optional[Dict[str, Any]],
     answers: Optional[Dict[str, Any]] = None,
+    parsed: Optional[ParsedAnswers] = None,
 ) -> Dict[str, Any]:
     if not pack:
         return brief
+    answers = answers or {}
+    pa = parsed or ParsedAnswers.from_answers(answers)
 
     communes = pack.get("communes") or []
     if not communes:
         return brief
 
-    # City label used for keyword fallbacks and copy; avoid NameError if not provided
-    city_name = _as_str((answers or {}).get('city') or brief.get('city') or (pack or {}).get('city') or 'Brussels')
-
-    # Allowed communes
-    allowed = [c.get("name") for c in communes if c.get("name")]
-    allowed_norm = {_norm_label(n): n for n in allowed}
-    commune_by_name = {c.get("name"): c for c in communes if c.get("name")}
+    # Allowed communes, score index and label lookups
+    px = _PackIndex.from_pack(pack)
+    allowed, allowed_norm, commune_by_name = px.allowed, px.allowed_norm, px.commune_by_name
 
     # Scoring and geo validators
-    score_index, score_dists = _build_commune_score_index(pack)
+    score_index, score_dists = px.score_index, px.score_dists
+    # Scores depend only on the commune (+ answers), never on shortlist position:
+    # compute them once per commune and look them up in both loops below.
+    # score_debug feeds the Q&A assistant ("why this score?"); deployments that
+    # don't use it can skip building it with BRIEF_DEBUG_SCORES=0.
+    debug_scores = os.environ.get("BRIEF_DEBUG_SCORES", "1").strip() != "0"
+    scores_by_name = {
+        c["name"]: (
+            _compute_scores_for_commune(c, score_index, score_dists, answers=answers, return_debug=True, parsed=pa)
+            if debug_scores
+            else (_compute_scores_for_commune(c, score_index, score_dists, answers=answers, parsed=pa), None)
+        )
+        for c in communes
+        if c.get("name")
+    }
     microhood_commune = _load_microhood_commune_map()
-    microhood_profiles = pack.get("microhood_profiles") or {}
-    microhood_profiles_norm = {_norm_label(k): v for k, v in microhood_profiles.items() if isinstance(k, str) and isinstance(v, dict)}
+    microhood_profiles_norm = px.microhood_profiles_norm
 
     # If a microhood name looks like it belongs to a different commune (e.g. "Jette Centre"),
     # drop it to avoid perception issues even when the geojson doesn't provide a mapping.
-    commune_tokens = {c: set(_norm_label(c).split()) for c in allowed}
+    commune_label_checks = px.commune_label_checks
 
     def _sent_end(t: str) -> str:
         t = _as_str(t).strip()
@@ -1222,64 +1807,87 @@ def _enforce_communes_and_microhoods(
             return t
         return t + "."
 
+    # commune name -> (microhoods_all, microhoods) indexed by normalized label;
+    # the first entry with a given label wins, as in a linear scan.
+    microhood_indexes = px.microhood_indexes
+
+    def _microhoods_by_label(commune_obj: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        key = commune_obj.get("name")
+        hit = microhood_indexes.get(key)
+        if hit is None:
+            indexes = []
+            for field in ("microhoods_all", "microhoods"):
+                by_label: Dict[str, Dict[str, Any]] = {}
+                for m in (commune_obj.get(field) or []):
+                    if isinstance(m, dict):
+                        by_label.setdefault(_norm_label(_as_str(m.get("name"))), m)
+                indexes.append(by_label)
+            hit = microhood_indexes[key] = (indexes[0], indexes[1])
+        return hit
+
     def _microhood_highlights_for(nm: str, commune_obj: Dict[str, Any]) -> str:
         """Return a microhood-specific 2–3 sentence blurb.
 
         We prefer curated microhood profiles from the city-pack (deterministic and unique).
         If a profile is missing, we fall back to metrics-based heuristics.
         """
-        prof = microhood_profiles_norm.get(_norm_label(nm)) or {}
+        nm_key = _norm_label(nm)
+        prof = microhood_profiles_norm.get(nm_key) or {}
         why_p = _sent_end(prof.get("why", ""))
         watch_p = _sent_end(prof.get("watch_out", ""))
         if why_p or watch_p:
             return " ".join([b for b in [why_p, watch_p] if b][:3]).strip()
 
         # Prefer microhoods_all (it contains metrics + tag_confidence).
-        mh_obj = next(
-            (
-                m
-                for m in (commune_obj.get("microhoods_all") or [])
-                if isinstance(m, dict) and _norm_label(_as_str(m.get("name"))) == _norm_label(nm)
-            ),
-            None,
-        )
+        all_by_label, curated_by_label = _microhoods_by_label(commune_obj)
+        mh_obj = all_by_label.get(nm_key)
         if not isinstance(mh_obj, dict):
-            mh_obj = next(
-                (
-                    m
-                    for m in (commune_obj.get("microhoods") or [])
-                    if isinstance(m, dict) and _norm_label(_as_str(m.get("name"))) == _norm_label(nm)
-                ),
-                {},
-            )
+            mh_obj = curated_by_label.get(nm_key, {})
         why_m, watch_m = _microhood_sentence_from_metrics(mh_obj if isinstance(mh_obj, dict) else {})
         return f"{_sent_end(why_m)} {_sent_end(watch_m)}".strip()
 
-    def _mk_microhood_entry(nm: str, commune_obj: Dict[str, Any], city_label: str) -> Dict[str, Any]:
-        kw_raw = [nm, nm.replace(" / ", " "), nm.replace("-", " "), city_label]
-        portal_keywords = _dedupe_str_list(kw_raw)[:4]
-        return {
-            "name": nm,
-            "portal_keywords": portal_keywords,
-            "highlights": _microhood_highlights_for(nm, commune_obj),
-        }
+    # (microhood, commune, city label) -> entry; a commune listed twice by the LLM
+    # reuses its entries instead of rebuilding keywords + highlights.
+    microhood_entries: Dict[Tuple[str, Any, str], Dict[str, Any]] = {}
 
-    def _belongs_to_other_commune(mh_name: str, current_commune: str) -> bool:
-        mh_norm = _norm_label(mh_name)
-        for other in allowed:
-            if other == current_commune:
-                continue
-            # strong signal: the other commune name (or a key token) is embedded in the microhood label
-            if _norm_label(other) in mh_norm:
-                return True
-            toks = commune_tokens.get(other) or set()
-            if toks and len(toks) == 1:
-                t = next(iter(toks))
-                if len(t) >= 5 and t in mh_norm:
-                    return True
-        return False
-
-    def _is_landmark_like_microhood(mh_obj: Dict[str, Any]) -> bool:
+    def _mk_microhood_entry(nm: str, commune_obj: Dict[str, Any], city_label: str) -> Dict[str, Any]:
+        key = (nm, commune_obj.get("name"), city_label)
+        entry = microhood_entries.get(key)
+        if entry is None:
+            kw_raw = [nm, nm.replace(" / ", " "), nm.replace("-", " "), city_label]
+            entry = {
+                "name": nm,
+                "portal_keywords": _dedupe_str_list(kw_raw)[:4],
+                "highlights": _microhood_highlights_for(nm, commune_obj),
+            }
+            microhood_entries[key] = entry
+        # Fresh containers: later stages (quality gate) edit entries in place.
+        return {**entry, "portal_keywords": list(entry["portal_keywords"])}
+
+    # current commune -> one compiled alternation of every *other* commune's label
+    # and distinctive token (None when there is nothing to reject).
+    other_commune_res = px.other_commune_res
+
+    def _other_commune_re(current_commune: str) -> Optional["re.Pattern[str]"]:
+        if current_commune not in other_commune_res:
+            needles = []
+            for other, other_norm, other_tok in commune_label_checks:
+                if other == current_commune:
+                    continue
+                needles.append(other_norm)
+                if other_tok:
+                    needles.append(other_tok)
+            needles = list(dict.fromkeys(needles))
+            other_commune_res[current_commune] = re.compile("|".join(map(re.escape, needles))) if needles else None
+        return other_commune_res[current_commune]
+
+    def _belongs_to_other_commune(mh_norm: str, current_commune: str) -> bool:
+        # strong signal: another commune name (or a key token) is embedded in the
+        # (already normalized) microhood label
+        rx = _other_commune_re(current_commune)
+        return rx is not None and rx.search(mh_norm) is not None
+
+    def _is_landmark_like_microhood(mh_obj: Dict[str, Any], mh_norm: Optional[str] = None) -> bool:
         """Heuristic filter: avoid recommending parks/forests as "microhoods".
 
         Some monitoring zones are very large green areas (e.g., Forêt de Soignes).
@@ -1287,9 +1895,8 @@ def _enforce_communes_and_microhoods(
         """
         if not isinstance(mh_obj, dict):
             return True
-        nm = _as_str(mh_obj.get("name"))
-        n = _norm_label(nm)
-        if any(k in n for k in ["foret", "forêt", "forest", "parc", "park", "bois", "cemet", "cimet"]):
+        n = mh_norm if mh_norm is not None else _norm_label(_as_str(mh_obj.get("name")))
+        if _RE_LANDMARK_WORDS.search(n):
             # allow known residential microhoods that contain one of these words (rare)
             # if they also have meaningful amenity density.
             m = mh_obj.get("metrics") or {}
@@ -1306,94 +1913,53 @@ def _enforce_communes_and_microhoods(
         return False
 
     # Tenure mode (affects phrasing and some checklists)
-    buy_lo, buy_hi = _parse_money_range((answers or {}).get("budget_buy"))
-    rent_lo, rent_hi = _parse_money_range((answers or {}).get("budget_rent"))
-    tenure = "buy" if (buy_hi or "buy" in _as_str((answers or {}).get("housing_type")).lower()) else "rent"
+    tenure = pa.tenure
 
     # Desired priorities (for "matched_priorities")
-    priority_ids = _split_csv((answers or {}).get("priority_tag_ids", ""))
-    top3_ids = _split_csv((answers or {}).get("priority_top3_ids", ""))
+    priority_ids = _split_csv(answers.get("priority_tag_ids", ""))
+    top3_ids = _split_csv(answers.get("priority_top3_ids", ""))
+    priority_set, top3_set = frozenset(priority_ids), frozenset(top3_ids)
 
     td_in = brief.get("top_districts")
     if not isinstance(td_in, list):
         td_in = []
 
-    fixed: List[Dict[str, Any]] = []
-    used = set()
-    for it in td_in:
-        if not isinstance(it, dict):
-            continue
-        raw_name = _as_str(it.get("name") or it.get("area"))
-        name = allowed_norm.get(_norm_label(raw_name))
-        if not name:
-            # pick next unused
-            name = next((n for n in allowed if n not in used), None)
-        if not name:
-            continue
-        used.add(name)
+    city_label = _as_str(pack.get("city_name") or pack.get("city") or answers.get("city") or "Brussels").strip()
 
-        commune = commune_by_name.get(name, {})
-        tags = commune.get("tags") or []
-        # Always compute scores deterministically from city-pack metrics + budget.
-        # This prevents "everything is 5/5" and improves trust.
-        scores, score_debug = _compute_scores_for_commune(
-            commune,
-            score_index,
-            score_dists,
-            answers=answers,
-            return_debug=True,
-        )
-
-        # Why / watch-out lists
-        why = _trim(_as_list(it.get("why")), LIMITS["district_why"])
-        watch = _trim(_as_list(it.get("watch_out")), LIMITS["district_watch"])
-        if len(why) < 2:
-            # Keep at least two bullets
-            first_mh = None
-            for mh in (commune.get("microhoods") or []):
-                if isinstance(mh, dict) and mh.get("name"):
-                    first_mh = _as_str(mh.get("name")).strip()
-                    break
-            anchor = first_mh or "key local hubs"
-            why = (why + [f"Strong fit for your priorities around {anchor}.", "Balanced trade-off between lifestyle and commute."])[:2]
-        if len(watch) < 1:
-            hint = _as_str(commune.get("watch_out_hint"))
-            watch = [hint or "Verify street-level noise/parking before shortlisting."]
-
-        # Microhoods: strictly two-level hierarchy Commune → Microhood.
-        # Use a deterministic ranking based on *all* user-selected priority tags.
-        filtered_all: List[Dict[str, Any]] = []
-        for mh in (commune.get("microhoods_all") or []):
-            if not isinstance(mh, dict) or not mh.get("name"):
-                continue
-            if _is_landmark_like_microhood(mh):
-                continue
-            nm = _as_str(mh.get("name")).strip()
-            if not nm:
-                continue
-            mapped = microhood_commune.get(_norm_label(nm))
-            if mapped and mapped != name:
-                continue
-            if _belongs_to_other_commune(nm, name):
-                continue
-            filtered_all.append(mh)
-
-        # Fallback if pack doesn't contain microhoods_all
-        if not filtered_all:
-            for mh in (commune.get("microhoods") or []):
+    def _filtered_microhoods(commune: Dict[str, Any], name: str) -> List[Dict[str, Any]]:
+        """Microhood candidates that really belong to this commune (and aren't landmarks)."""
+        # Prefer microhoods_all; fall back to the curated list if it yields nothing.
+        for key in ("microhoods_all", "microhoods"):
+            filtered: List[Dict[str, Any]] = []
+            for mh in (commune.get(key) or []):
                 if not isinstance(mh, dict) or not mh.get("name"):
                     continue
-                if _is_landmark_like_microhood(mh):
-                    continue
                 nm = _as_str(mh.get("name")).strip()
+                # One normalized label shared by every check below.
+                nm_key = _norm_label(nm)
+                if _is_landmark_like_microhood(mh, nm_key):
+                    continue
                 if not nm:
                     continue
-                mapped = microhood_commune.get(_norm_label(nm))
+                mapped = microhood_commune.get(nm_key)
                 if mapped and mapped != name:
                     continue
-                if _belongs_to_other_commune(nm, name):
+                if _belongs_to_other_commune(nm_key, name):
                     continue
-                filtered_all.append(mh)
+                filtered.append(mh)
+            if filtered:
+                return filtered
+        return []
+
+    def _district_entry(name: str, commune: Dict[str, Any], why: List[str], watch: List[str]) -> Dict[str, Any]:
+        tags = commune.get("tags") or []
+        # Always compute scores deterministically from city-pack metrics + budget.
+        # This prevents "everything is 5/5" and improves trust.
+        scores, score_debug = scores_by_name[name]
+
+        # Microhoods: strictly two-level hierarchy Commune → Microhood.
+        # Use a deterministic ranking based on *all* user-selected priority tags.
+        filtered_all = _filtered_microhoods(commune, name)
 
         # Rank using tag registry. All selected tags influence the score.
         commune_for_rank = dict(commune)
@@ -1416,54 +1982,78 @@ def _enforce_communes_and_microhoods(
                 if len(mh_candidates) >= 2:
                     break
 
-        city_label = _as_str(pack.get("city_name") or pack.get("city") or answers.get("city") or "Brussels").strip()
-
         out_mh = [_mk_microhood_entry(nm, commune, city_label) for nm in mh_candidates[:2]]
         while len(out_mh) < 2:
             out_mh.append(_mk_microhood_entry(f"Area {len(out_mh)+1}", commune, city_label))
 
-        top_microhoods = [m.get("name") for m in out_mh if isinstance(m, dict) and m.get("name")][:2]
+        top_microhoods = _first_names(out_mh, 2)
 
         # Derive short, user-facing helpers used by the PDF renderer.
-        # These MUST be computed before we append; otherwise missing optional
-        # fields can cause UnboundLocalError at runtime.
-        snapshot = _priority_snapshot(tags, scores, metrics=commune.get("metrics") or {})
-
-        # Budget reality is computed from user answers + scores; keep this call
-        # aligned with the helper signature.
-        budget_reality = _budget_reality_check(
-            tags=tags,
-            scores=scores,
+        extras = _compute_district_extras(
+            tags,
+            scores,
+            commune,
+            anchors=top_microhoods,
+            tenure=tenure,
             answers=answers,
-            commune=commune,
             score_index=score_index,
+            parsed=pa,
         )
 
-        strengths, tradeoffs = _derive_strengths_tradeoffs(
-            tags=tags,
-            snapshot=commune.get("snapshot", {}) or {},
-            anchors=top_microhoods,
-            scores=scores,
-            tenure=tenure,
-        )
+        return {
+            "name": name,
+            "scores": scores,
+            "score_debug": score_debug,
+            "microhood_score_debug": microhood_debug,
+            "why": why,
+            "watch_out": watch,
+            "strengths": extras["strengths"],
+            "tradeoffs": extras["tradeoffs"],
+            "matched_priorities": _priority_match(tags, priority_set, top3_set),
+            "priority_snapshot": extras["snapshot"],
+            "budget_reality": extras["budget_reality"],
+            "top_microhoods": top_microhoods,
+            "microhoods": out_mh,
+        }
 
-        fixed.append(
-            {
-                "name": name,
-                "scores": scores,
-                "score_debug": score_debug,
-                "microhood_score_debug": microhood_debug,
-                "why": why,
-                "watch_out": watch,
-                "strengths": strengths,
-                "tradeoffs": tradeoffs,
-                "matched_priorities": _priority_match(tags, priority_ids, top3_ids),
-                "priority_snapshot": snapshot,
-                "budget_reality": budget_reality,
-                "top_microhoods": top_microhoods,
-                "microhoods": out_mh,
-            }
-        )
+    fixed: List[Dict[str, Any]] = []
+    used = set()
+    # allowed[:next_free] are all used; `used` only grows, so the first unused
+    # commune never moves backwards and the fallback scan stays amortized O(1).
+    next_free = 0
+    for it in td_in:
+        if not isinstance(it, dict):
+            continue
+        raw_name = _as_str(it.get("name") or it.get("area"))
+        name = allowed_norm.get(_norm_label(raw_name))
+        if not name:
+            # pick next unused
+            while next_free < len(allowed) and allowed[next_free] in used:
+                next_free += 1
+            name = allowed[next_free] if next_free < len(allowed) else None
+        if not name:
+            continue
+        used.add(name)
+
+        commune = commune_by_name.get(name, {})
+
+        # Why / watch-out lists
+        why = _trim(_as_list(it.get("why")), LIMITS["district_why"])
+        watch = _trim(_as_list(it.get("watch_out")), LIMITS["district_watch"])
+        if len(why) < 2:
+            # Keep at least two bullets
+            first_mh = None
+            for mh in (commune.get("microhoods") or []):
+                if isinstance(mh, dict) and mh.get("name"):
+                    first_mh = _as_str(mh.get("name")).strip()
+                    break
+            anchor = first_mh or "key local hubs"
+            why = (why + [f"Strong fit for your priorities around {anchor}.", "Balanced trade-off between lifestyle and commute."])[:2]
+        if len(watch) < 1:
+            hint = _as_str(commune.get("watch_out_hint"))
+            watch = [hint or "Verify street-level noise/parking before shortlisting."]
+
+        fixed.append(_district_entry(name, commune, why, watch))
 
     # Add remaining communes as candidates for deterministic ranking.
     # This removes dependency on the LLM-proposed shortlist and prevents
@@ -1473,109 +2063,11 @@ def _enforce_communes_and_microhoods(
             continue
 
         commune = commune_by_name.get(n, {})
-        tags = commune.get("tags") or []
-        scores, score_debug = _compute_scores_for_commune(
-            commune,
-            score_index,
-            score_dists,
-            answers=answers,
-            return_debug=True,
-        )
         why = ["Strong fit for your stated priorities.", "Balanced trade-off between lifestyle and commute."]
         hint = _as_str(commune.get("watch_out_hint"))
         watch = [hint or "Verify street-level noise/parking before shortlisting."]
 
-        filtered_all: List[Dict[str, Any]] = []
-        for mh in (commune.get("microhoods_all") or []):
-            if not isinstance(mh, dict) or not mh.get("name"):
-                continue
-            if _is_landmark_like_microhood(mh):
-                continue
-            nm = _as_str(mh.get("name")).strip()
-            if not nm:
-                continue
-            mapped = microhood_commune.get(_norm_label(nm))
-            if mapped and mapped != n:
-                continue
-            if _belongs_to_other_commune(nm, n):
-                continue
-            filtered_all.append(mh)
-
-        if not filtered_all:
-            for mh in (commune.get("microhoods") or []):
-                if not isinstance(mh, dict) or not mh.get("name"):
-                    continue
-                if _is_landmark_like_microhood(mh):
-                    continue
-                nm = _as_str(mh.get("name")).strip()
-                if not nm:
-                    continue
-                mapped = microhood_commune.get(_norm_label(nm))
-                if mapped and mapped != n:
-                    continue
-                if _belongs_to_other_commune(nm, n):
-                    continue
-                filtered_all.append(mh)
-
-        commune_for_rank = dict(commune)
-        commune_for_rank["microhoods_all"] = filtered_all
-        ranked_names, microhood_debug = rank_microhoods_for_commune(
-            commune_for_rank,
-            priority_tag_ids=priority_ids,
-            priority_top3_ids=top3_ids,
-            limit=2,
-            diversity=True,
-        )
-
-        mh_candidates: List[str] = [x for x in ranked_names if isinstance(x, str) and x]
-        if len(mh_candidates) < 2:
-            for mh in filtered_all:
-                nm = _as_str(mh.get("name")).strip()
-                if nm and nm not in mh_candidates:
-                    mh_candidates.append(nm)
-                if len(mh_candidates) >= 2:
-                    break
-
-        city_label = _as_str(pack.get("city_name") or pack.get("city") or answers.get("city") or "Brussels").strip()
-
-        out_mh = [_mk_microhood_entry(nm, commune, city_label) for nm in mh_candidates[:2]]
-        while len(out_mh) < 2:
-            out_mh.append(_mk_microhood_entry(f"Area {len(out_mh)+1}", commune, city_label))
-
-        top_microhoods = [m.get("name") for m in out_mh if isinstance(m, dict) and m.get("name")][:2]
-        snapshot = _priority_snapshot(tags, scores, metrics=commune.get("metrics") or {})
-        budget_reality = _budget_reality_check(
-            tags=tags,
-            scores=scores,
-            answers=answers,
-            commune=commune,
-            score_index=score_index,
-        )
-        strengths, tradeoffs = _derive_strengths_tradeoffs(
-            tags=tags,
-            snapshot=commune.get("snapshot", {}) or {},
-            anchors=top_microhoods,
-            scores=scores,
-            tenure=tenure,
-        )
-        fixed.append(
-            {
-                "name": n,
-                "scores": scores,
-                "score_debug": score_debug,
-                "microhood_score_debug": microhood_debug,
-                "why": why,
-                "watch_out": watch,
-                "strengths": strengths,
-                "tradeoffs": tradeoffs,
-                "matched_priorities": _priority_match(tags, priority_ids, top3_ids),
-                "priority_snapshot": snapshot,
-                "budget_reality": budget_reality,
-                "top_microhoods": top_microhoods,
-                "microhoods": out_mh,
-            }
-        )
-
+        fixed.append(_district_entry(n, commune, why, watch))
 
     # Deterministic ranking: primary = profile-weighted match to the user's
     # selected priorities (top-3 stronger), secondary = Overall consistency.
@@ -1585,8 +2077,7 @@ def _enforce_communes_and_microhoods(
         priority_top3_ids=top3_ids,
         tag_dim_map=tag_dim_map,
     )
-    ranked = rank_communes(fixed, weights=weights)
-    brief["top_districts"] = ranked[:3]
+    brief["top_districts"] = rank_communes(fixed, weights=weights, limit=3)
     return brief
 
 
@@ -1601,8 +2092,8 @@ def normalize_brief(
         brief = {"client_profile": _as_str(brief)}
 
     answers = answers or {}
-    buy_lo, buy_hi = _parse_money_range(answers.get("budget_buy"))
-    is_buy = bool(buy_hi or ("buy" in _as_str(answers.get("housing_type")).lower()))
+    pa = ParsedAnswers.from_answers(answers)
+    is_buy = pa.is_buy
 
     out: Dict[str, Any] = {}
 
@@ -1623,108 +2114,42 @@ def normalize_brief(
 
     # If the model provided too few steps, expand deterministically.
     if len(out["next_steps"]) < 8:
-        default_steps_buy = [
-            "Shortlist 8–12 listings across the 3 communes and set up viewings.",
-            "Confirm total purchase cost: price + notary/registration fees + recurring charges.",
-            "Validate commute: run one test route at peak hours (public transport and by car if relevant).",
-            "Ask about parking (permit vs private spot), storage, and building rules.",
-            "Prepare a document pack for offers: ID, proof of funds/pre-approval, and key questions for the seller.",
-            "Request EPC, urbanism/permit docs, and recent syndic/HOA minutes before committing.",
-            "Do an evening walk-through for your top 2 choices to assess noise and street feel.",
-            "Plan your notary steps and financing timeline; align deed date with your move plan.",
-            "Book a second visit with measurements/photos to compare objectively.",
-            "If needed, line up a survey/technical inspection for building issues.",
-        ]
-        default_steps_rent = [
-            "Shortlist 8–12 listings across the 3 communes and set up viewings.",
-            "Confirm total monthly cost: rent + charges + utilities (and what's included).",
-            "Validate commute: run one test route at peak hours (public transport and by car if relevant).",
-            "Ask about parking rules/permits and bike/storage options.",
-            "Prepare a rental document pack: ID, proof of income, employer letter, bank statements.",
-            "For the top 2 options, do an evening walk-through to assess noise and safety.",
-            "Clarify contract length, notice period, indexation, and deposit rules.",
-            "Book a second visit with measurements and photos to compare objectively.",
-            "Pre-validate a rental guarantee to move fast on good listings.",
-            "Confirm handover checklist and inventory (appliances/fixtures) in writing.",
-        ]
         out["next_steps"] = (
             out["next_steps"]
-            + (default_steps_buy if is_buy else default_steps_rent)
+            + list(DEFAULT_NEXT_STEPS_BUY if is_buy else DEFAULT_NEXT_STEPS_RENT)
         )[: LIMITS["next_steps"]]
 
     # Practical checklists (for 'act tomorrow')
     if "viewing_checklist" not in out:
-        out["viewing_checklist"] = [
-            "Noise: check windows closed/open, street vs courtyard orientation.",
-            "Heating & insulation: type, EPC score, drafts, humidity/mold signs.",
-            "Charges: what's included (common areas, heating, water) and past statements.",
-            "Building works: planned renovations, roof/façade, lift, syndic notes.",
-            "Internet/cell coverage: quick speed test on site.",
-            "Storage: cellar, bike room, stroller access, elevator size.",
-            "Parking: permit eligibility, private spot, guest parking, EV charging.",
-            "Safety basics: entrance, lighting, intercom, visibility at night.",
-        ]
+        out["viewing_checklist"] = list(DEFAULT_VIEWING_CHECKLIST)
         if is_buy:
             out["viewing_checklist"] += [
                 "Documents: EPC, urbanism/permit info, recent syndic/HOA minutes.",
-                "Total budget: mortgage + recurring charges + utilities + insurance + taxes.",
+                _VIEWING_BUDGET_BUY,
             ]
         else:
-            out["viewing_checklist"] += [
-                "Appliances/fixtures: inventory list and condition (rental check-in).",
-                "Total budget: rent + charges + utilities + insurance.",
-            ]
+            out["viewing_checklist"] += [_VIEWING_APPLIANCES_RENT, _VIEWING_BUDGET_RENT]
     else:
         # Sanitize generic lines that confuse buy vs rent mode.
-        vc = _as_list(out.get("viewing_checklist"))
+        # _as_list already yields stripped, non-empty strings.
+        budget_line = _VIEWING_BUDGET_BUY if is_buy else _VIEWING_BUDGET_RENT
         cleaned = []
-        for line in vc:
-            l = _as_str(line)
-            low = _norm_label(l)
+        for line in _as_list(out.get("viewing_checklist")):
+            low = _norm_label(line)
             if "appliances/fixtures" in low:
-                if is_buy:
-                    continue
-                cleaned.append("Appliances/fixtures: inventory list and condition (rental check-in).")
-                continue
-            if low.startswith("total budget"):
-                cleaned.append(
-                    "Total budget: mortgage + recurring charges + utilities + insurance + taxes." if is_buy else "Total budget: rent + charges + utilities + insurance."
-                )
-                continue
-            cleaned.append(l)
+                if not is_buy:
+                    cleaned.append(_VIEWING_APPLIANCES_RENT)
+            elif low.startswith("total budget"):
+                cleaned.append(budget_line)
+            else:
+                cleaned.append(line)
         out["viewing_checklist"] = cleaned
-    out.setdefault(
-        "offer_strategy",
-        [
-            "Move quickly on strong listings: good units can disappear within days.",
-            "Clarify conditions (financing, sale of current property) early; keep them realistic.",
-            "Ask for EPC, urbanism info, and syndic documents before committing (buying).",
-            "Confirm timelines: offer validity, deed date (buying) or move-in date (renting).",
-            "Negotiate on total package: included furniture, repairs, parking spot, charges.",
-        ],
-    )
+    out.setdefault("offer_strategy", list(DEFAULT_OFFER_STRATEGY))
 
     # Relocation essentials (operational steps beyond real estate)
     out.setdefault(
         "relocation_essentials",
-        {
-            "first_72h": [
-                "Set up a local SIM / data plan and enable 2FA for banking.",
-                "Confirm temporary address and keep copies of the lease / purchase agreement.",
-                "Book commune appointment for registration (as soon as address is confirmed).",
-            ],
-            "first_2_weeks": [
-                "Register at the commune (address registration); follow up on police check if required.",
-                "Choose a GP (médecin généraliste) and register with a mutualité (health fund).",
-                "Arrange energy + internet contracts if not included (electricity/gas/internet).",
-                "If you have a child: shortlist daycare/schools and start the application process.",
-            ],
-            "first_2_months": [
-                "Set up a Belgian bank account if needed and update payroll details.",
-                "Review insurance (home contents, liability); confirm coverage start date.",
-                "If driving: confirm parking permit process, resident rules, and any LEZ requirements.",
-            ],
-        },
+        {k: list(items) for k, items in DEFAULT_RELOCATION_ESSENTIALS},
     )
 
     # Sanitize relocation-essentials copy to avoid confusing instructions.
@@ -1745,25 +2170,15 @@ def normalize_brief(
         out["relocation_essentials"] = essentials
 
     # Relocation admin checklist (kept high-level to avoid false precision)
-    out.setdefault(
-        "registration_checklist",
-        [
-            "Valid passport/ID + visa/residence documents (if applicable).",
-            "Proof of address: signed lease / deed / housing attestation.",
-            "Civil status docs if relevant (marriage/birth certificates) — bring originals and copies.",
-            "Work proof: contract or employer letter (useful for some registrations).",
-            "Keep digital scans of all documents and a folder for commune appointments.",
-            "Confirm appointment booking channel (commune website/IRISbox when applicable) and required forms.",
-        ],
-    )
+    out.setdefault("registration_checklist", list(DEFAULT_REGISTRATION_CHECKLIST))
 
     # Determine city pack
-    city_key = (city or _as_str(brief.get("city")) or _as_str((answers or {}).get("city"))).strip()
+    city_key = (city or _as_str(brief.get("city")) or _as_str(answers.get("city"))).strip()
     pack = load_city_pack(city_key)
 
     # Enforce top_districts + microhoods from pack only
     out["top_districts"] = brief.get("top_districts")
-    out = _enforce_communes_and_microhoods(out, pack, answers=answers)
+    out = _enforce_communes_and_microhoods(out, pack, answers=answers, parsed=pa)
 
     # Always take resources from the city pack for Belgium (stable list).
     # Support both the legacy structure (real_estate_sites / agencies) and
@@ -1777,36 +2192,33 @@ def normalize_brief(
         out["agencies"] = _norm_links(brief.get("agencies"))
 
     # Methodology (helps trust): keep it short and deterministic.
-    top3 = [d.get("name") for d in (out.get("top_districts") or []) if isinstance(d, dict) and d.get("name")]
-    priority_ids = _split_csv((answers or {}).get("priority_tag_ids", ""))
-    priority_top3 = _split_csv((answers or {}).get("priority_top3_ids", ""))
-    meth_inputs = []
-    if (answers or {}).get("housing_type"):
-        meth_inputs.append(f"Housing type: {(answers or {}).get('housing_type')}")
-    if (answers or {}).get("budget_rent"):
-        meth_inputs.append(f"Budget (rent): {(answers or {}).get('budget_rent')}")
-    if (answers or {}).get("budget_buy"):
-        meth_inputs.append(f"Budget (buy): {(answers or {}).get('budget_buy')}")
-    if (answers or {}).get("office_commute"):
-        meth_inputs.append(f"Work commute: {(answers or {}).get('office_commute')}")
-    if (answers or {}).get("school_commute"):
-        meth_inputs.append(f"School commute: {(answers or {}).get('school_commute')}")
-
-    out["methodology"] = {
-        "inputs": meth_inputs[:6],
-        "matching": [
-            "We only recommend communes and microhoods from the city pack (no invented areas).",
-            "Scores are computed from city-pack signals (amenities, transport, parks) + your budget.",
-            f"Priority tags matched: {', '.join(priority_top3 or priority_ids[:3]) or '—' }.",
-            f"Shortlist produced: {', '.join(top3) or '—' }.",
-        ],
-    }
+    # The shortlist head feeds both the methodology copy and the executive summary.
+    head = _slice(out, "top_districts", 3)
+    top3 = [d.get("name") for d in head if isinstance(d, dict) and d.get("name")]
+    if not answers:
+        # Public/demo mode: nothing to echo back, only the shortlist varies.
+        out["methodology"] = _methodology_block([], "—", ", ".join(top3) or "—")
+    else:
+        priority_ids = _split_csv(answers.get("priority_tag_ids", ""))
+        priority_top3 = _split_csv(answers.get("priority_top3_ids", ""))
+        meth_inputs = []
+        for key, prefix in METHODOLOGY_INPUT_LABELS:
+            v = answers.get(key)
+            if v:
+                meth_inputs.append(prefix + str(v))
+        out["methodology"] = _methodology_block(
+            meth_inputs,
+            ", ".join(priority_top3 or priority_ids[:3]) or "—",
+            ", ".join(top3) or "—",
+        )
 
     # Reduce copy/paste feel across the shortlist (UX/Copy).
-    try:
-        _uniqueize_shortlist_copy(out.get("top_districts") or [], answers=answers)
-    except Exception:
-        pass
+    td = out.get("top_districts")
+    if td:
+        try:
+            _uniqueize_shortlist_copy(td, answers=answers)
+        except Exception:
+            pass
 
     def _strip_ellipsis(text: str) -> str:
         # Executive summary must never show literal ellipsis characters.
@@ -1825,35 +2237,31 @@ def normalize_brief(
             return "—"
 
         # Remove parenthetical noise which often makes phrases too long.
-        t = re.sub(r"\s*\([^)]*\)", "", t).strip()
-
-        # Prefer a full first sentence if available.
-        for sep in [".", ";", ":"]:
-            if sep in t:
-                chunk = t.split(sep, 1)[0].strip()
+        if "(" in t:
+            t = _RE_PARENS.sub("", t).strip()
+
+        # Prefer a full first sentence if available, else cut at the first
+        # comma (still a complete clause). Separators are tried in priority
+        # order, not by position; find + slice avoids building split lists.
+        for sep in ".;:,":
+            idx = t.find(sep)
+            if idx >= 0:
+                chunk = t[:idx].strip()
                 if chunk:
                     return chunk.rstrip(" ,;") + "."
 
-        # Else, cut at the first comma (still a complete clause).
-        if "," in t:
-            chunk = t.split(",", 1)[0].strip()
-            if chunk:
-                return chunk.rstrip(" ,;") + "."
-
         # Already short-ish; ensure it ends cleanly.
         return t.rstrip(" ,;") + ("." if not t.endswith((".", "!", "?")) else "")
 
     # Executive summary lines for quick scanning (no copy/paste from cards).
     out["executive_summary"] = []
-    for d in (out.get("top_districts") or [])[:3]:
+    for d in head:
         if not isinstance(d, dict):
             continue
         name = _as_str(d.get("name"))
         strengths = _as_list(d.get("strengths"))
         tradeoffs = _as_list(d.get("tradeoffs"))
-        microhoods = [
-            _as_str(x) for x in (d.get("top_microhoods") or []) if _as_str(x)
-        ][:2]
+        microhoods = _first_strs(d.get("top_microhoods"), 2)
         keywords = []
         mp = d.get("matched_priorities") or {}
         if isinstance(mp, dict):
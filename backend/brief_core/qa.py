@@ -1,19 +1,55 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import math
 import os
 import re
+import threading
 import time
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .memo import identity_cache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
 
 # ---------- Markdown chunking / anchors ----------
 
 _slug_re = re.compile(r"[^a-z0-9]+")
+# start at ##; [^\S\n] keeps the heading on its own line in multiline mode
+_heading_re = re.compile(r"^(#{2,6})[^\S\n]+(.*)$", re.MULTILINE)
+# _tokenize: after lower() + ASCII encode ("?" for anything else), every byte
+# outside [a-z0-9] becomes a space in one bytes.translate pass.
+_TOKEN_BYTES = bytes(c if (48 <= c <= 57 or 97 <= c <= 122) else 32 for c in range(256))
+_ws_re = re.compile(r"\s+")
+
+# _safe_json_from_text: markdown fences around model output
+_fence_open_re = re.compile(r"^```(?:json)?\s*", re.IGNORECASE)
+_fence_close_re = re.compile(r"\s*```$")
+_json_decoder = json.JSONDecoder()
+
+# Question routing
+_vs_re = re.compile(r"(.+?)\s+(?:vs\.?|versus)\s+(.+)", re.IGNORECASE)
+_higher_re = re.compile(r"(.+?)\s+(?:higher than|above)\s+(.+)", re.IGNORECASE)
+# One pass over the question for every router keyword. Apart from whole-word
+# "why" these are plain substrings ("ranked" counts as "rank").
+_intent_re = re.compile(r"\bwhy\b|explain|compare|higher|first|#1|top|rank|lower|ahead|above|below")
+_WHY_INTENTS = frozenset({"why", "explain"})
 
 
 def _slugify(text: str) -> str:
@@ -28,85 +64,175 @@ class MdChunk:
     anchor: str
     level: int
     text: str
+    # Token bags for rank_chunks, built on first use and reused by later questions.
+    _term_counts: Optional[Counter] = field(default=None, init=False, repr=False, compare=False)
+    _title_terms: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def term_counts(self) -> Counter:
+        if self._term_counts is None:
+            self._term_counts = Counter(_tokenize(self.text))
+        return self._term_counts
+
+    def title_terms(self) -> FrozenSet[str]:
+        if self._title_terms is None:
+            self._title_terms = frozenset(_tokenize(self.title))
+        return self._title_terms
 
 
 def split_md_by_headings(md: str) -> List[MdChunk]:
     """
     Split markdown into chunks by headings (## / ### / ####...).
-    Each chunk includes the heading line and following content until next heading of same or higher level.
+    Each chunk includes the heading line and following content until the next heading.
     """
-    lines = (md or "").splitlines()
-    chunks: List[MdChunk] = []
+    # One C-level pass folds every line break splitlines() knows onto "\n", so
+    # chunks are plain slices of the text between heading starts.
+    text = "\n".join((md or "").splitlines())
+    # Only lines starting with "##" can be headings: jump between them with
+    # str.find instead of visiting every line (or every char with finditer).
+    starts = [0] if text.startswith("##") else []
+    i = text.find("\n##")
+    while i >= 0:
+        starts.append(i + 1)
+        i = text.find("\n##", i + 1)
+    matches = [m for p in starts if (m := _heading_re.match(text, p))]
+    # anything before the first heading (H1 title etc.) is ignored for retrieval
+    ends = [m.start() for m in matches[1:]] + [len(text)]
+    return [
+        MdChunk(
+            title=(title := m.group(2).strip()),
+            anchor=_slugify(title),
+            level=len(m.group(1)),
+            text=text[m.start():end].strip(),
+        )
+        for m, end in zip(matches, ends)
+    ]
 
-    current_title: Optional[str] = None
-    current_level: int = 0
-    current_lines: List[str] = []
 
-    def flush():
-        nonlocal current_title, current_level, current_lines
-        if current_title is None:
-            return
-        text = "\n".join(current_lines).strip()
-        chunks.append(
-            MdChunk(
-                title=current_title,
-                anchor=_slugify(current_title),
-                level=current_level,
-                text=text,
-            )
-        )
+@lru_cache(maxsize=int(os.environ.get("QA_MD_CACHE_SIZE", "32")))
+def _split_md_cached(md: str) -> Tuple[MdChunk, ...]:
+    """split_md_by_headings, memoized per markdown text.
 
-    heading_re = re.compile(r"^(#{2,6})\s+(.*)\s*$")  # start at ##
-    for ln in lines:
-        m = heading_re.match(ln)
-        if m:
-            hashes = m.group(1)
-            title = m.group(2).strip()
-            level = len(hashes)
-            # start new chunk
-            flush()
-            current_title = title
-            current_level = level
-            current_lines = [ln]
-        else:
-            if current_title is None:
-                # ignore preamble (H1 title etc.) for retrieval
-                continue
-            current_lines.append(ln)
+    A brief's markdown is split for every question (anchor lookups + ranking);
+    sharing the chunks also shares their cached token bags. Treat as read-only.
+    """
+    return tuple(split_md_by_headings(md))
+
+
+@lru_cache(maxsize=int(os.environ.get("QA_MD_CACHE_SIZE", "32")))
+def _md_title_index(md: str) -> Tuple[Tuple[str, MdChunk], ...]:
+    """(lowercased title, chunk) in document order, built once per markdown text."""
+    return tuple(((c.title or "").lower(), c) for c in _split_md_cached(md))
 
-    flush()
-    return chunks
+
+def _finite_json(x: Any) -> Any:
+    """Copy of x with NaN/Infinity replaced by None (orjson writes those as null)."""
+    if isinstance(x, float):
+        return x if math.isfinite(x) else None
+    if isinstance(x, dict):
+        return {k: _finite_json(v) for k, v in x.items()}
+    if isinstance(x, (list, tuple)):
+        return [_finite_json(v) for v in x]
+    return x
+
+
+def _json_bytes(x: Any) -> bytes:
+    """Compact UTF-8 JSON; orjson when installed, same text from the stdlib.
+
+    Both paths write non-finite floats as null, so the LLM cache key does not
+    depend on which serializer is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(x)
+        except TypeError:  # e.g. non-str keys: let the stdlib coerce them
+            pass
+    try:
+        text = json.dumps(x, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError:  # NaN/Infinity somewhere: rare, so only then pay for the copy
+        text = json.dumps(_finite_json(x), ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return text.encode("utf-8")
 
 
 def _tokenize(text: str) -> List[str]:
-    text = (text or "").lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
+    text = (text or "").lower().encode("ascii", "replace").translate(_TOKEN_BYTES).decode("ascii")
     parts = [p for p in text.split() if len(p) >= 2]
     return parts
 
 
-def rank_chunks(question: str, chunks: List[MdChunk], top_k: int = 6) -> List[Tuple[MdChunk, float]]:
+def _clip_at_word(text: str, limit: int) -> str:
+    """First `limit` chars cut back to the last space, with an ellipsis (rpartition: no list)."""
+    cut = text[:limit]
+    head, sep, _ = cut.rpartition(" ")
+    return (head if sep else cut) + "…"
+
+
+# BM25 (Okapi) parameters for rank_chunks / _pick_verified_excerpts.
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
+
+class _Bm25Stats(NamedTuple):
+    idf: Dict[str, float]
+    doc_lens: List[int]
+    avg_len: float
+
+    @classmethod
+    def from_counts(cls, bags: Sequence[Counter]) -> "_Bm25Stats":
+        n = len(bags)
+        df: Counter = Counter()
+        for bag in bags:
+            df.update(bag.keys())
+        idf = {t: math.log((n - d + 0.5) / (d + 0.5) + 1.0) for t, d in df.items()}
+        doc_lens = [sum(bag.values()) for bag in bags]
+        avg_len = (sum(doc_lens) / n) if n else 0.0
+        return cls(idf, doc_lens, avg_len or 1.0)
+
+    def score(self, q_terms: Iterable[str], counts: Counter, doc_len: int) -> float:
+        """BM25 of one document: rare terms weigh more, long boilerplate sections less."""
+        norm = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * doc_len / self.avg_len)
+        score = 0.0
+        for t in q_terms:
+            tf = counts.get(t)
+            if tf:
+                score += self.idf.get(t, 0.0) * tf * (_BM25_K1 + 1.0) / (tf + norm)
+        return score
+
+
+# id(chunks) -> (chunks, stats); see identity_cache. _split_md_cached hands out one
+# tuple per brief, so stats are built once per brief; only tuples are cached, since
+# a caller's list can change under the same id.
+_BM25_STATS_CACHE: Dict[int, Tuple[Sequence[MdChunk], _Bm25Stats]] = {}
+_BM25_STATS_CACHE_MAX = 32
+
+
+def _chunk_bm25_stats(chunks: Sequence[MdChunk]) -> _Bm25Stats:
+    if not isinstance(chunks, tuple):
+        return _Bm25Stats.from_counts([c.term_counts() for c in chunks])
+    return identity_cache(
+        _BM25_STATS_CACHE,
+        _BM25_STATS_CACHE_MAX,
+        chunks,
+        lambda: _Bm25Stats.from_counts([c.term_counts() for c in chunks]),
+    )
+
+
+def rank_chunks(question: str, chunks: Sequence[MdChunk], top_k: int = 6) -> List[Tuple[MdChunk, float]]:
     """
-    Simple keyword scoring (MVP): sum of term matches + small bonus for title matches.
+    Keyword scoring: BM25 over the brief's chunks + idf-weighted bonus for title matches.
+
+    Terms are matched as whole tokens against each chunk's cached token bag; the
+    corpus statistics (idf, lengths) are computed once per chunk tuple.
     """
     q_terms = _tokenize(question)
     if not q_terms:
         return [(c, 0.0) for c in chunks[:top_k]]
 
     q_set = set(q_terms)
+    stats = _chunk_bm25_stats(chunks)
     ranked: List[Tuple[MdChunk, float]] = []
-    for c in chunks:
-        hay = (c.text or "").lower()
-        title = (c.title or "").lower()
-        score = 0.0
-        # term frequency-ish
-        for t in q_set:
-            if t in title:
-                score += 2.5
-            if t in hay:
-                # count occurrences, capped
-                cnt = hay.count(t)
-                score += min(6, cnt) * 1.0
+    for c, doc_len in zip(chunks, stats.doc_lens):
+        score = stats.score(q_set, c.term_counts(), doc_len)
+        score += 2.5 * sum(stats.idf.get(t, 0.0) for t in q_set.intersection(c.title_terms()))
         # prefer higher-level headings slightly (## over ####)
         score += max(0.0, 0.6 - 0.1 * (c.level - 2))
         ranked.append((c, score))
@@ -131,11 +257,69 @@ DEFAULT_OFFICIAL_DOMAINS = [
 def _official_domains() -> List[str]:
     raw = (os.environ.get("OFFICIAL_DOMAINS") or "").strip()
     if raw:
-        parts = [p.strip() for p in raw.split(",") if p.strip()]
+        parts = [t for p in raw.split(",") if (t := p.strip())]
         return parts or DEFAULT_OFFICIAL_DOMAINS
     return DEFAULT_OFFICIAL_DOMAINS
 
 
+class _TTLCache:
+    """Small thread-safe LRU whose entries expire after ttl_s seconds."""
+
+    def __init__(self, maxsize: int, ttl_s: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            if hit[0] < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return hit[1]
+
+    def put(self, key: Any, value: Any) -> None:
+        if self.maxsize <= 0 or self.ttl_s <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_s, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+# Re-asked questions (reloads, follow-ups) skip both network calls; TTL bounds staleness.
+_QA_CACHE_TTL_S = float(os.environ.get("QA_CACHE_TTL_S", "900"))
+_QA_CACHE_SIZE = int(os.environ.get("QA_CACHE_SIZE", "256"))
+_TAVILY_CACHE = _TTLCache(_QA_CACHE_SIZE, _QA_CACHE_TTL_S)
+_LLM_CACHE = _TTLCache(_QA_CACHE_SIZE, _QA_CACHE_TTL_S)
+
+
+def _make_tavily_session() -> requests.Session:
+    """Pooled keep-alive session: verified questions reuse the TCP/TLS connection."""
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"POST"}),  # search is read-only, safe to retry
+        raise_on_status=False,  # hand the last response to raise_for_status() as before
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    return session
+
+
+_TAVILY_SESSION = _make_tavily_session()
+# Verified mode runs the search here while the request thread ranks chunks.
+_TAVILY_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tavily")
+# Caps concurrent Tavily HTTP calls across all callers (cache hits don't count).
+_TAVILY_INFLIGHT = threading.BoundedSemaphore(max(1, int(os.environ.get("TAVILY_MAX_INFLIGHT", "4"))))
+
+
 def tavily_search_official(query: str, *, max_results: int = 5, timeout_s: int = 25) -> List[Dict[str, Any]]:
     """
     Search the web using Tavily, restricted to an allowlist of official domains.
@@ -145,16 +329,25 @@ def tavily_search_official(query: str, *, max_results: int = 5, timeout_s: int =
     if not api_key:
         raise RuntimeError("TAVILY_API_KEY is not set (required for verified lookup).")
 
+    domains = _official_domains()
+    depth = os.environ.get("TAVILY_SEARCH_DEPTH", "basic")
+    key = (query, tuple(domains), int(max_results), depth)
+    hit = _TAVILY_CACHE.get(key)
+    if hit is not None:
+        # callers truncate excerpts in place; hand out fresh dicts
+        return [dict(r) for r in hit]
+
     payload = {
         "api_key": api_key,
         "query": query,
         "max_results": int(max_results),
-        "include_domains": _official_domains(),
-        "search_depth": os.environ.get("TAVILY_SEARCH_DEPTH", "basic"),
+        "include_domains": domains,
+        "search_depth": depth,
         "include_answer": False,
         "include_raw_content": False,
     }
-    resp = requests.post("https://api.tavily.com/search", json=payload, timeout=timeout_s)
+    with _TAVILY_INFLIGHT:
+        resp = _TAVILY_SESSION.post("https://api.tavily.com/search", json=payload, timeout=timeout_s)
     resp.raise_for_status()
     data = resp.json() or {}
     out: List[Dict[str, Any]] = []
@@ -165,30 +358,49 @@ def tavily_search_official(query: str, *, max_results: int = 5, timeout_s: int =
         if not url or not content:
             continue
         out.append({"url": url, "title": title, "content": content})
+    _TAVILY_CACHE.put(key, tuple(dict(r) for r in out))
     return out
 
 
+def tavily_search_official_batch(
+    queries: Sequence[str], *, max_results: int = 5, timeout_s: int = 25
+) -> List[List[Dict[str, Any]]]:
+    """
+    Run several official-domain searches concurrently (e.g. pre-fetching follow-up
+    questions), so they cost one round trip of wall time instead of one each.
+    Returns result lists aligned with `queries`; results land in the Tavily cache,
+    so a later tavily_search_official for the same query is served locally.
+    """
+    futures: Dict[str, Future] = {}
+    for q in queries:
+        if q not in futures:
+            futures[q] = _TAVILY_EXECUTOR.submit(
+                tavily_search_official, q, max_results=max_results, timeout_s=timeout_s
+            )
+    wait(futures.values())
+    # duplicate queries share one search; hand each slot its own dicts
+    return [[dict(r) for r in futures[q].result()] for q in queries]
+
+
 def _pick_verified_excerpts(question: str, results: List[Dict[str, Any]], max_excerpts: int = 4) -> List[Dict[str, Any]]:
     """
     Take Tavily snippets and pick the most relevant excerpts.
     We keep them short to avoid prompt bloat and to keep citations crisp.
     """
     q_terms = set(_tokenize(question))
-    scored: List[Tuple[Dict[str, Any], float]] = []
-    for r in results:
-        text = (r.get("content") or "").lower()
-        score = 0.0
-        for t in q_terms:
-            if t in text:
-                score += min(6, text.count(t))
-        scored.append((r, score))
+    # The results form a small corpus of their own: BM25 over it, like rank_chunks.
+    bags = [Counter(_tokenize(r.get("content") or "")) for r in results]
+    stats = _Bm25Stats.from_counts(bags)
+    scored: List[Tuple[Dict[str, Any], float]] = [
+        (r, stats.score(q_terms, bag, doc_len)) for r, bag, doc_len in zip(results, bags, stats.doc_lens)
+    ]
     scored.sort(key=lambda x: x[1], reverse=True)
     picked = [r for r, _ in scored[:max_excerpts]]
     # truncate content
     for r in picked:
         c = r.get("content") or ""
         if len(c) > 850:
-            r["content"] = c[:850].rsplit(" ", 1)[0] + "…"
+            r["content"] = _clip_at_word(c, 850)
     return picked
 
 
@@ -222,6 +434,33 @@ def _extract_resp_text(resp: Any) -> str:
         return ""
 
 
+def _complete_text(client: Any, **kwargs: Any) -> str:
+    """Model reply text, streamed so we can stop as soon as a full JSON object has arrived.
+
+    The reply is expected to be one JSON object; anything after its closing brace
+    (a fence, trailing prose) is not worth waiting for. SDKs without
+    responses.stream fall back to a blocking create().
+    """
+    stream_fn = getattr(client.responses, "stream", None)
+    if stream_fn is None:
+        return _extract_resp_text(client.responses.create(**kwargs))
+    buf: List[str] = []
+    with stream_fn(**kwargs) as stream:
+        for event in stream:
+            if getattr(event, "type", None) != "response.output_text.delta":
+                continue
+            delta = getattr(event, "delta", "") or ""
+            buf.append(delta)
+            if "}" in delta:
+                text = "".join(buf)
+                if _safe_json_from_text(text) is not None:
+                    return text
+        text = "".join(buf)
+        if text:
+            return text
+        return _extract_resp_text(stream.get_final_response())
+
+
 def _safe_json_from_text(text: str) -> Optional[Dict[str, Any]]:
     """Best-effort JSON extraction.
 
@@ -237,8 +476,8 @@ def _safe_json_from_text(text: str) -> Optional[Dict[str, Any]]:
         return None
 
     # common markdown fences
-    raw = re.sub(r"^```(?:json)?\s*", "", raw, flags=re.IGNORECASE).strip()
-    raw = re.sub(r"\s*```$", "", raw).strip()
+    raw = _fence_open_re.sub("", raw).strip()
+    raw = _fence_close_re.sub("", raw).strip()
 
     try:
         obj = json.loads(raw)
@@ -246,29 +485,16 @@ def _safe_json_from_text(text: str) -> Optional[Dict[str, Any]]:
     except Exception:
         pass
 
-    # Extract first JSON object by brace matching
+    # Decode the first JSON object in place; the C scanner stops at its closing
+    # brace and, unlike naive brace counting, ignores braces inside strings.
     start = raw.find("{")
     if start < 0:
         return None
-    depth = 0
-    end = -1
-    for i in range(start, len(raw)):
-        ch = raw[i]
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                end = i
-                break
-    if end < 0:
-        return None
-    snippet = raw[start : end + 1]
     try:
-        obj = json.loads(snippet)
-        return obj if isinstance(obj, dict) else None
-    except Exception:
+        obj, _end = _json_decoder.raw_decode(raw, start)
+    except ValueError:
         return None
+    return obj if isinstance(obj, dict) else None
 
 
 def _norm_top_districts(norm: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -284,17 +510,64 @@ def _norm_top_districts(norm: Dict[str, Any]) -> List[Dict[str, Any]]:
     return []
 
 
+def _norm_name(s: str) -> str:
+    return _ws_re.sub(" ", (s or "").strip().lower())
+
+
+class _DistrictIndex(NamedTuple):
+    top_names: List[str]  # display names in rank order
+    by_name: Dict[str, Dict[str, Any]]  # lowercased name -> first district with it
+    mention_names: List[Tuple[str, str]]  # (name, lowered), longest first
+
+    @classmethod
+    def from_districts(cls, districts: List[Dict[str, Any]]) -> "_DistrictIndex":
+        top_names: List[str] = []
+        by_name: Dict[str, Dict[str, Any]] = {}
+        mention_names: List[Tuple[str, str]] = []
+        for d in districts:
+            raw = d.get("name") or d.get("commune")
+            n = (raw or "").strip()
+            if raw:
+                top_names.append(n)
+            by_name.setdefault(n.lower(), d)
+            if n:
+                mention_names.append((n, n.lower()))
+        # longest match first
+        mention_names.sort(key=lambda t: len(t[0]), reverse=True)
+        return cls(top_names, by_name, mention_names)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.by_name.get((name or "").strip().lower())
+
+    def find(self, name: str) -> Optional[Dict[str, Any]]:
+        """Looser lookup for free-text compare operands: whitespace-normalized, then containment."""
+        key = _norm_name(name)
+        if not key:
+            return None
+        hit = self.by_name.get(key)
+        if hit is not None:
+            return hit
+        for k, d in self.by_name.items():
+            if k and (key in k or k in key):
+                return d
+        return None
+
+
+# id(districts) -> (districts, index); see identity_cache.
+_DISTRICT_INDEX_CACHE: Dict[int, Tuple[List[Dict[str, Any]], _DistrictIndex]] = {}
+_DISTRICT_INDEX_CACHE_MAX = 64
+
+
+def _district_index(districts: List[Dict[str, Any]]) -> _DistrictIndex:
+    return identity_cache(
+        _DISTRICT_INDEX_CACHE, _DISTRICT_INDEX_CACHE_MAX, districts, lambda: _DistrictIndex.from_districts(districts)
+    )
+
+
 def _find_district_mention(question: str, districts: List[Dict[str, Any]]) -> Optional[str]:
     q = (question or "").lower()
-    names: List[str] = []
-    for d in districts:
-        n = (d.get("name") or d.get("commune") or "").strip()
-        if n:
-            names.append(n)
-    # longest match first
-    names.sort(key=len, reverse=True)
-    for n in names:
-        if n.lower() in q:
+    for n, nl in _district_index(districts).mention_names:
+        if nl in q:
             return n
     return None
 
@@ -302,181 +575,261 @@ def _find_district_mention(question: str, districts: List[Dict[str, Any]]) -> Op
 def _slug_to_anchor_from_md(md_text: str, contains: str) -> Tuple[str, str]:
     """Pick a reasonable anchor/snippet by scanning chunk titles."""
     contains_l = (contains or "").lower()
-    for c in split_md_by_headings(md_text or ""):
-        if contains_l in (c.title or "").lower():
+    # first match in document order wins, so this stays a scan rather than a dict hit
+    for title_l, c in _md_title_index(md_text or ""):
+        if contains_l in title_l:
             snip = (c.text or "").strip().splitlines()
             sn = "\n".join(snip[:3]).strip()
             if len(sn) > 220:
-                sn = sn[:220].rsplit(" ", 1)[0] + "…"
+                sn = _clip_at_word(sn, 220)
             return c.anchor, sn
     return "", ""
 
 
+def _summary_citation_anchor(md_text: str) -> Tuple[str, str]:
+    anchor, snippet = _slug_to_anchor_from_md(md_text, "Executive summary")
+    if not anchor:
+        anchor, snippet = _slug_to_anchor_from_md(md_text, "Top")
+    return anchor, snippet
+
+
+def _compare_pair(question: str) -> Optional[Tuple[str, str]]:
+    """Simple compare pattern: "X vs Y" or "X higher than Y" (the latter wins)."""
+    m = _higher_re.search(question) or _vs_re.search(question)
+    if not m:
+        return None
+    return m.group(1).strip(), m.group(2).strip()
+
+
+def _why_reasons(d0: Dict[str, Any]) -> List[str]:
+    """Pick 2-3 reasons: prefer score_debug, then matched_priorities/why."""
+    reasons: List[str] = []
+    sd = d0.get("score_debug")
+    if isinstance(sd, dict):
+        # Take top 3 debug strings by key order preference
+        for k in ["Family", "Lifestyle", "BudgetFit", "Safety", "Commute", "Overall"]:
+            v = sd.get(k)
+            if isinstance(v, list):
+                for item in v:
+                    if isinstance(item, str) and item.strip():
+                        reasons.append(item.strip())
+                    if len(reasons) >= 3:
+                        break
+            elif isinstance(v, str) and v.strip():
+                reasons.append(v.strip())
+            if len(reasons) >= 3:
+                break
+        # Newer score_debug schema: use matched priorities + strongest dimensions
+        if not reasons:
+            mp = d0.get("matched_priorities")
+            if isinstance(mp, list) and mp:
+                reasons.append("Matched priorities: " + ", ".join([str(x) for x in mp[:5]]))
+        if not reasons:
+            sc = (sd.get("scores") if isinstance(sd.get("scores"), dict) else d0.get("scores")) or {}
+            if isinstance(sc, dict) and sc:
+                dims = [(k, v) for k, v in sc.items() if k and k != "Overall" and isinstance(v, (int, float))]
+                dims.sort(key=lambda kv: kv[1], reverse=True)
+                for k, v in dims[:2]:
+                    reasons.append(f"Strong {k} ({int(v)}/5) for your case")
+        if not reasons:
+            b = sd.get("budget") if isinstance(sd.get("budget"), dict) else None
+            if b and b.get("mode"):
+                reasons.append(f"Budget fit is {b.get('final', b.get('base'))}/5 given your {b.get('mode')} budget")
+    if not reasons:
+        wp = d0.get("why")
+        if isinstance(wp, list):
+            reasons.extend([t for x in wp if (t := str(x).strip())][:3])
+    if not reasons:
+        mp = d0.get("matched_priorities")
+        if isinstance(mp, list):
+            reasons.append("Matched priorities: " + ", ".join([str(x) for x in mp[:5]]))
+    return reasons
+
+
+def _debug_bullets(reasons: Any) -> List[str]:
+    """score_debug dict or why/priorities list as short readable bullets."""
+    bullets: List[str] = []
+    if isinstance(reasons, dict):
+        for k, v in reasons.items():
+            if isinstance(v, list) and v:
+                bullets.append(f"{k}: {v[0]}")
+            elif isinstance(v, str) and v.strip():
+                bullets.append(f"{k}: {v}")
+    elif isinstance(reasons, list):
+        bullets.extend([str(x) for x in reasons if str(x).strip()])
+    return bullets
+
+
+def _ranking_citation(md_text: str) -> Dict[str, str]:
+    anchor, snip = _summary_citation_anchor(md_text)
+    if anchor:
+        return {"label": "Executive summary", "anchor": anchor, "snippet": snip}
+    return {"label": "Ranking logic", "anchor": "", "snippet": "Based on top_districts scores and score_debug in norm.json"}
+
+
+def _compare_answer(d1: Dict[str, Any], d2: Dict[str, Any], md_text: str) -> Dict[str, Any]:
+    n1 = d1.get("name") or d1.get("commune")
+    n2 = d2.get("name") or d2.get("commune")
+    s1 = d1.get("scores") or {}
+    s2 = d2.get("scores") or {}
+    # pick top differing dimensions
+    dims = [k for k in ("Family", "Safety", "Commute", "Lifestyle", "BudgetFit", "Overall") if k in s1 and k in s2]
+    diffs = []
+    for k in dims:
+        try:
+            diffs.append((k, float(s1.get(k, 0)) - float(s2.get(k, 0))))
+        except Exception:
+            continue
+    diffs.sort(key=lambda x: abs(x[1]), reverse=True)
+    bullets = []
+    for k, dv in diffs[:3]:
+        if dv == 0:
+            continue
+        sign = "+" if dv > 0 else ""
+        bullets.append(f"{k}: {n1} {sign}{int(dv)} vs {n2}")
+
+    r1 = _debug_bullets(d1.get("score_debug") or d1.get("why") or [])[:2]
+    r2 = _debug_bullets(d2.get("score_debug") or d2.get("why") or [])[:2]
+
+    answer = (
+        f"{n1} ranks higher than {n2} in this brief because it matches your priorities better across key scoring dimensions.\n"
+        + "\n".join([f"- {b}" for b in bullets[:3]])
+    )
+    if r1:
+        answer += "\n- Key factors for " + str(n1) + ": " + "; ".join(r1)
+    if r2:
+        answer += "\n- Trade-offs for " + str(n2) + ": " + "; ".join(r2)
+
+    return {
+        "answer": answer.strip(),
+        "citations": [_ranking_citation(md_text)],
+        "confidence": 0.85,
+    }
+
+
+def _why_first_answer(d: Dict[str, Any], districts: List[Dict[str, Any]], md_text: str) -> Dict[str, Any]:
+    name = d.get("name") or d.get("commune")
+    s = d.get("scores") or {}
+    bullets = _debug_bullets(d.get("score_debug") or d.get("matched_priorities") or d.get("why") or [])
+
+    # fallback bullets: highlight strongest dimensions
+    if not bullets:
+        dims = ["Family", "Safety", "Lifestyle", "Commute", "BudgetFit", "Overall"]
+        dim_scores = [(k, s.get(k)) for k in dims if k in s]
+        for k, v in dim_scores[:3]:
+            bullets.append(f"{k}: {v}/5")
+
+    # If question is about a non-#1 district, explain its position
+    pos = None
+    for i, dd in enumerate(districts, start=1):
+        if _norm_name(dd.get("name") or dd.get("commune") or "") == _norm_name(name):
+            pos = i
+            break
+
+    conclusion = f"{name} is ranked #1 for your brief because it best matches your selected priorities and scores strongly on the most relevant dimensions."
+    if pos and pos != 1:
+        conclusion = f"{name} is ranked #{pos} in your brief because it matches your priorities well, but another commune scores slightly better on your top drivers."
+
+    out = conclusion + "\n" + "\n".join([f"- {b}" for b in bullets[:4]])
+    return {
+        "answer": out.strip(),
+        "citations": [_ranking_citation(md_text)],
+        "confidence": 0.9,
+    }
+
+
+def _why_answer(d0: Dict[str, Any], target: str, top_names: List[str], md_text: str) -> Dict[str, Any]:
+    reasons = _why_reasons(d0)
+    scores = d0.get("scores") or {}
+    overall = None
+    if isinstance(scores, dict):
+        overall = scores.get("Overall")
+
+    # citation anchor/snippet from MD
+    anchor, snippet = _summary_citation_anchor(md_text)
+
+    bullets = []
+    if overall is not None:
+        bullets.append(f"Overall score: {overall}/5")
+    for r in reasons[:3]:
+        bullets.append(r)
+
+    answer = f"{target} ranks #{top_names.index(target)+1 if target in top_names else 1} for your inputs."
+    # keep concise
+    if len(bullets) > 0:
+        answer += "\n" + "\n".join([f"- {b}" for b in bullets[:4]])
+
+    return {
+        "answer": answer,
+        "citations": [
+            {"label": "Executive summary", "anchor": anchor, "snippet": snippet}
+        ]
+        if anchor
+        else [],
+        "confidence": 0.85,
+    }
+
+
 def _deterministic_why_rank_answer(
     *,
     question: str,
     md_text: str,
     norm: Dict[str, Any],
+    compare: bool = False,
 ) -> Optional[Dict[str, Any]]:
     """Answer ranking/"why" questions directly from norm.json.
 
     This avoids brittle retrieval and does not depend on LLM formatting.
+    Returns None when the question is not one the router handles.
+
+    By default this is answer_question's router: why/explain questions about a
+    named (or, for "first", the top) district. compare=True routes the way the
+    older standalone helper did instead: "X vs Y" / "X higher than Y" comparisons
+    plus its "why is X first" explanation. answer_question leaves it off, so
+    compare questions keep going to the model.
     """
-    q = (question or "").strip()
-    ql = q.lower()
-    districts = _norm_top_districts(norm)
+    districts = _norm_top_districts(norm or {})
     if not districts:
         return None
+    ql = (question or "").lower()
 
-    is_rank_q = any(x in ql for x in ("why", "rank", "first", "#1", "top", "higher", "lower", "compare"))
-    if not is_rank_q:
-        return None
-
-    mentioned = _find_district_mention(q, districts)
-
-    # Simple compare pattern: "X vs Y" or "X higher than Y"
-    compare = None
-    m_vs = re.search(r"(.+?)\s+(?:vs\.?|versus)\s+(.+)", q, flags=re.IGNORECASE)
-    if m_vs:
-        compare = (m_vs.group(1).strip(), m_vs.group(2).strip())
-    m_higher = re.search(r"(.+?)\s+(?:higher than|above)\s+(.+)", q, flags=re.IGNORECASE)
-    if m_higher:
-        compare = (m_higher.group(1).strip(), m_higher.group(2).strip())
-
-    # Build a lookup by normalized name
-    def norm_name(s: str) -> str:
-        return re.sub(r"\s+", " ", (s or "").strip().lower())
-
-    by_name = {norm_name(d.get("name") or d.get("commune") or ""): d for d in districts if (d.get("name") or d.get("commune"))}
-
-    def get_d(name: str) -> Optional[Dict[str, Any]]:
-        if not name:
-            return None
-        key = norm_name(name)
-        if key in by_name:
-            return by_name[key]
-        # partial/contains match
-        for k, v in by_name.items():
-            if key in k or k in key:
-                return v
-        return None
-
-    # If compare, answer comparison
     if compare:
-        d1 = get_d(compare[0])
-        d2 = get_d(compare[1])
-        if d1 and d2:
-            n1 = d1.get("name") or d1.get("commune")
-            n2 = d2.get("name") or d2.get("commune")
-            s1 = d1.get("scores") or {}
-            s2 = d2.get("scores") or {}
-            # pick top differing dimensions
-            dims = [k for k in ("Family", "Safety", "Commute", "Lifestyle", "BudgetFit", "Overall") if k in s1 and k in s2]
-            diffs = []
-            for k in dims:
-                try:
-                    diffs.append((k, float(s1.get(k, 0)) - float(s2.get(k, 0))))
-                except Exception:
-                    continue
-            diffs.sort(key=lambda x: abs(x[1]), reverse=True)
-            bullets = []
-            for k, dv in diffs[:3]:
-                if dv == 0:
-                    continue
-                sign = "+" if dv > 0 else ""
-                bullets.append(f"{k}: {n1} {sign}{int(dv)} vs {n2}")
-
-            why1 = (d1.get("score_debug") or d1.get("why") or [])
-            why2 = (d2.get("score_debug") or d2.get("why") or [])
-            # score_debug may be dict; normalize to list of short reasons
-            def reasons(x):
-                if isinstance(x, list):
-                    return [str(i) for i in x if str(i).strip()][:2]
-                if isinstance(x, dict):
-                    out=[]
-                    for kk,vv in x.items():
-                        if isinstance(vv, list) and vv:
-                            out.append(f"{kk}: {vv[0]}")
-                        elif isinstance(vv, str) and vv.strip():
-                            out.append(f"{kk}: {vv}")
-                    return out[:2]
-                return []
-            r1 = reasons(why1)
-            r2 = reasons(why2)
-
-            anchor, snip = _slug_to_anchor_from_md(md_text, "Executive summary")
-            if not anchor:
-                anchor, snip = _slug_to_anchor_from_md(md_text, "Top")
-            answer = (
-                f"{n1} ranks higher than {n2} in this brief because it matches your priorities better across key scoring dimensions.\n"
-                + "\n".join([f"- {b}" for b in bullets[:3]])
-            )
-            if r1:
-                answer += "\n- Key factors for " + str(n1) + ": " + "; ".join(r1)
-            if r2:
-                answer += "\n- Trade-offs for " + str(n2) + ": " + "; ".join(r2)
-
-            return {
-                "answer": answer.strip(),
-                "citations": [
-                    {"label": "Executive summary", "anchor": anchor, "snippet": snip} if anchor else {"label": "Ranking logic", "anchor": "", "snippet": "Based on top_districts scores and score_debug in norm.json"}
-                ],
-                "confidence": 0.85,
-            }
-
-    # Otherwise, "why first" for a mentioned district
-    if ("first" in ql or "#1" in ql or "top" in ql) and ("why" in ql or "rank" in ql or "first" in ql):
-        target_name = mentioned or (districts[0].get("name") or districts[0].get("commune"))
-        d = get_d(target_name)
-        if not d:
+        if not any(x in ql for x in ("why", "rank", "first", "#1", "top", "higher", "lower", "compare")):
             return None
+        index = _district_index(districts)
+        pair = _compare_pair(question or "")
+        if pair:
+            d1 = index.find(pair[0])
+            d2 = index.find(pair[1])
+            if d1 and d2:
+                return _compare_answer(d1, d2, md_text)
+        if ("first" in ql or "#1" in ql or "top" in ql) and ("why" in ql or "rank" in ql or "first" in ql):
+            mentioned = _find_district_mention(question, districts)
+            d = index.find(mentioned or districts[0].get("name") or districts[0].get("commune") or "")
+            if d:
+                return _why_first_answer(d, districts, md_text)
+        return None
 
-        name = d.get("name") or d.get("commune")
-        s = d.get("scores") or {}
-        reasons = d.get("score_debug") or d.get("matched_priorities") or d.get("why") or []
-        # Normalize reasons to a few readable bullets
-        bullets: List[str] = []
-        if isinstance(reasons, dict):
-            for k, v in reasons.items():
-                if isinstance(v, list) and v:
-                    bullets.append(f"{k}: {v[0]}")
-                elif isinstance(v, str) and v.strip():
-                    bullets.append(f"{k}: {v}")
-        elif isinstance(reasons, list):
-            bullets.extend([str(x) for x in reasons if str(x).strip()])
-
-        # fallback bullets: highlight strongest dimensions
-        if not bullets:
-            dims = ["Family", "Safety", "Lifestyle", "Commute", "BudgetFit", "Overall"]
-            dim_scores = [(k, s.get(k)) for k in dims if k in s]
-            for k, v in dim_scores[:3]:
-                bullets.append(f"{k}: {v}/5")
-
-        anchor, snip = _slug_to_anchor_from_md(md_text, "Executive summary")
-        if not anchor:
-            anchor, snip = _slug_to_anchor_from_md(md_text, "Top")
-
-        # If question is about a non-#1 district, explain its position
-        pos = None
-        for i, dd in enumerate(districts, start=1):
-            if norm_name(dd.get("name") or dd.get("commune") or "") == norm_name(name):
-                pos = i
-                break
-
-        conclusion = f"{name} is ranked #1 for your brief because it best matches your selected priorities and scores strongly on the most relevant dimensions."
-        if pos and pos != 1:
-            conclusion = f"{name} is ranked #{pos} in your brief because it matches your priorities well, but another commune scores slightly better on your top drivers."
+    hits = set(_intent_re.findall(ql))
+    is_why = not _WHY_INTENTS.isdisjoint(hits)
+    if not (is_why or "compare" in hits or "higher" in hits):
+        return None
+    is_rank = bool(hits - _WHY_INTENTS)
+    mentioned = _find_district_mention(question, districts)
+    if not (mentioned or is_rank):
+        return None
 
-        out = conclusion + "\n" + "\n".join([f"- {b}" for b in bullets[:4]])
-        return {
-            "answer": out.strip(),
-            "citations": [
-                {"label": "Executive summary", "anchor": anchor, "snippet": snip} if anchor else {"label": "Ranking logic", "anchor": "", "snippet": "Based on top_districts scores and score_debug in norm.json"}
-            ],
-            "confidence": 0.9,
-        }
+    # Explain the mentioned district (default to #1 if asking about "first")
+    index = _district_index(districts)
+    top_names = index.top_names
+    target = mentioned
+    if ("first" in hits or "#1" in hits) and top_names:
+        target = target or top_names[0]
 
-    return None
+    d0 = index.get(target) if target else None
+    if not d0:
+        return None
+    return _why_answer(d0, target, top_names, md_text)
 
 
 REPORT_ONLY_SYSTEM = """You are a real-estate broker style consultant for relocation.
@@ -502,136 +855,27 @@ confidence is 0-1 float.
 """
 
 
-def answer_question(
-    *,
-    brief_id: str,
-    question: str,
-    md_text: str,
-    norm: Dict[str, Any],
-    mode: str = "report_only",
-) -> Dict[str, Any]:
-    """
-    mode: 'report_only' or 'verified'
-    """
-    mode = (mode or "report_only").strip().lower()
-    if mode not in ("report_only", "verified"):
-        mode = "report_only"
+# brief_id -> (norm, compact); see identity_cache. A re-loaded or regenerated
+# norm.json is a new object, so it is compacted afresh.
+_NORM_COMPACT_CACHE: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+_NORM_COMPACT_CACHE_MAX = 64
 
-    # --- Deterministic router for common "why / compare / ranking" questions ---
-    districts = _norm_top_districts(norm or {})
-    ql = (question or "").lower()
-    is_why = bool(re.search(r"\bwhy\b", ql)) or "explain" in ql
-    is_rank = any(k in ql for k in ["first", "#1", "top", "rank", "higher", "lower", "ahead", "above", "below", "compare"])
-    mentioned = _find_district_mention(question, districts)
-    if districts and (is_why or "compare" in ql or "higher" in ql) and (mentioned or is_rank):
-        # Build a deterministic explanation from norm.json (source of truth).
-        top_names = [
-            (d.get("name") or d.get("commune") or "").strip()
-            for d in districts
-            if (d.get("name") or d.get("commune"))
-        ]
-        # identify target district (default to #1 if asking about "first")
-        target = mentioned
-        if ("first" in ql or "#1" in ql) and top_names:
-            target = target or top_names[0]
-
-        def get_d(name: str) -> Optional[Dict[str, Any]]:
-            for d in districts:
-                dn = (d.get("name") or d.get("commune") or "").strip()
-                if dn.lower() == (name or "").strip().lower():
-                    return d
-            return None
 
-        d0 = get_d(target) if target else None
-        if d0:
-            # pick 2-3 reasons: prefer score_debug, then matched_priorities/why
-            reasons: List[str] = []
-            sd = d0.get("score_debug")
-            if isinstance(sd, dict):
-                # Take top 3 debug strings by key order preference
-                for k in ["Family", "Lifestyle", "BudgetFit", "Safety", "Commute", "Overall"]:
-                    v = sd.get(k)
-                    if isinstance(v, list):
-                        for item in v:
-                            if isinstance(item, str) and item.strip():
-                                reasons.append(item.strip())
-                            if len(reasons) >= 3:
-                                break
-                    elif isinstance(v, str) and v.strip():
-                        reasons.append(v.strip())
-                    if len(reasons) >= 3:
-                        break
-                # Newer score_debug schema: use matched priorities + strongest dimensions
-                if not reasons:
-                    mp = d0.get("matched_priorities")
-                    if isinstance(mp, list) and mp:
-                        reasons.append("Matched priorities: " + ", ".join([str(x) for x in mp[:5]]))
-                if not reasons:
-                    sc = (sd.get("scores") if isinstance(sd.get("scores"), dict) else d0.get("scores")) or {}
-                    if isinstance(sc, dict) and sc:
-                        dims = [(k, v) for k, v in sc.items() if k and k != "Overall" and isinstance(v, (int, float))]
-                        dims.sort(key=lambda kv: kv[1], reverse=True)
-                        for k, v in dims[:2]:
-                            reasons.append(f"Strong {k} ({int(v)}/5) for your case")
-                if not reasons:
-                    b = sd.get("budget") if isinstance(sd.get("budget"), dict) else None
-                    if b and b.get("mode"):
-                        reasons.append(f"Budget fit is {b.get('final', b.get('base'))}/5 given your {b.get('mode')} budget")
-            if not reasons:
-                wp = d0.get("why")
-                if isinstance(wp, list):
-                    reasons.extend([str(x).strip() for x in wp if str(x).strip()][:3])
-            if not reasons:
-                mp = d0.get("matched_priorities")
-                if isinstance(mp, list):
-                    reasons.append("Matched priorities: " + ", ".join([str(x) for x in mp[:5]]))
-
-            scores = d0.get("scores") or {}
-            overall = None
-            if isinstance(scores, dict):
-                overall = scores.get("Overall")
-
-            # citation anchor/snippet from MD
-            anchor, snippet = _slug_to_anchor_from_md(md_text, "Executive summary")
-            if not anchor:
-                anchor, snippet = _slug_to_anchor_from_md(md_text, "Top")
-
-            bullets = []
-            if overall is not None:
-                bullets.append(f"Overall score: {overall}/5")
-            for r in reasons[:3]:
-                bullets.append(r)
-
-            answer = f"{target} ranks #{top_names.index(target)+1 if target in top_names else 1} for your inputs."
-            # keep concise
-            if len(bullets) > 0:
-                answer += "\n" + "\n".join([f"- {b}" for b in bullets[:4]])
-
-            return {
-                "answer": answer,
-                "citations": [
-                    {"label": "Executive summary", "anchor": anchor, "snippet": snippet}
-                ]
-                if anchor
-                else [],
-                "confidence": 0.85,
-                "mode": mode,
-            }
+def _norm_compact(brief_id: str, norm: Dict[str, Any], norm_key: Any = None) -> Dict[str, Any]:
+    """Compact norm.json for QA (avoid huge prompt); built once per brief/norm version.
 
-    chunks = split_md_by_headings(md_text or "")
-    ranked = rank_chunks(question, chunks, top_k=6)
+    The version is the identity of norm_key, or of norm itself when none is given.
+    """
+    return identity_cache(
+        _NORM_COMPACT_CACHE,
+        _NORM_COMPACT_CACHE_MAX,
+        norm if norm_key is None else norm_key,
+        lambda: _build_norm_compact(norm),
+        key=brief_id,
+    )
 
-    top_chunks = []
-    for c, score in ranked:
-        if score <= 0 and len(top_chunks) >= 3:
-            break
-        # keep chunk text compact
-        txt = c.text.strip()
-        if len(txt) > 1600:
-            txt = txt[:1600].rsplit(" ", 1)[0] + "…"
-        top_chunks.append({"title": c.title, "anchor": c.anchor, "text": txt})
 
-    # Compact norm.json for QA (avoid huge prompt)
+def _build_norm_compact(norm: Dict[str, Any]) -> Dict[str, Any]:
     # Note: current norm schema uses top_districts[] entries (commune + microhoods) instead of top_communes.
     top_districts = _norm_top_districts(norm or {})
     top_districts_compact: List[Dict[str, Any]] = []
@@ -653,7 +897,7 @@ def answer_question(
             }
         )
 
-    norm_compact = {
+    return {
         "client_profile": norm.get("client_profile"),
         "must_have": norm.get("must_have"),
         "nice_to_have": norm.get("nice_to_have"),
@@ -663,13 +907,71 @@ def answer_question(
         "quality_warnings": norm.get("quality_warnings"),
     }
 
-    official_excerpts: List[Dict[str, Any]] = []
+
+def answer_question(
+    *,
+    brief_id: str,
+    question: str,
+    md_text: str,
+    norm: Dict[str, Any],
+    mode: str = "report_only",
+    norm_key: Any = None,
+) -> Dict[str, Any]:
+    """
+    mode: 'report_only' or 'verified'
+    norm_key: optional object whose identity stands for this version of norm in
+    the QA caches, for callers that pass a per-request copy of a shared norm
+    """
+    mode = (mode or "report_only").strip().lower()
+    if mode not in ("report_only", "verified"):
+        mode = "report_only"
+
+    # --- Deterministic router for common "why / compare / ranking" questions ---
+    routed = _deterministic_why_rank_answer(question=question, md_text=md_text, norm=norm)
+    # Runs before any chunking, norm compaction or network call, so a hit costs
+    # no OpenAI/Tavily round trip.
+    if routed is not None:
+        routed["mode"] = mode
+        routed["source"] = "deterministic"
+        return routed
+
+    search: Optional[Future] = None
     if mode == "verified":
         # build a stable query (avoid sending too much personal data)
-        city = (norm.get("city") or norm_compact.get("city") or "").strip() or "Brussels"
-        q = f"{question} {city}"
-        results = tavily_search_official(q, max_results=int(os.environ.get("TAVILY_MAX_RESULTS", "6")))
-        official_excerpts = _pick_verified_excerpts(question, results, max_excerpts=int(os.environ.get("TAVILY_MAX_EXCERPTS", "4")))
+        city = (norm.get("city") or "").strip() or "Brussels"
+        search = _TAVILY_EXECUTOR.submit(
+            tavily_search_official,
+            f"{question} {city}",
+            max_results=int(os.environ.get("TAVILY_MAX_RESULTS", "6")),
+        )
+
+    chunks = _split_md_cached(md_text or "")
+    ranked = rank_chunks(question, chunks, top_k=int(os.environ.get("QA_TOP_CHUNKS", "6")))
+
+    top_chunks = []
+    for c, score in ranked:
+        if score <= 0 and len(top_chunks) >= 3:
+            break
+        # keep chunk text compact
+        txt = c.text.strip()
+        if len(txt) > 1600:
+            txt = _clip_at_word(txt, 1600)
+        top_chunks.append({"title": c.title, "anchor": c.anchor, "text": txt})
+
+    norm_compact = _norm_compact(brief_id, norm, norm_key)
+
+    official_excerpts: List[Dict[str, Any]] = []
+    if search is not None:
+        try:
+            # With session retries one search can outlast its 25 s HTTP timeout
+            # several times over; don't hold the request longer than this.
+            results = search.result(timeout=float(os.environ.get("TAVILY_WAIT_S", "30")))
+        except FutureTimeoutError:
+            # Answer from the report alone; the search still finishes and lands
+            # in the Tavily cache for a retry.
+            mode = "report_only"
+        else:
+            official_excerpts = _pick_verified_excerpts(question, results, max_excerpts=int(os.environ.get("TAVILY_MAX_EXCERPTS", "4")))
 
     system = VERIFIED_SYSTEM if mode == "verified" else REPORT_ONLY_SYSTEM
 
@@ -681,23 +983,36 @@ def answer_question(
         "mode": mode,
     }
 
-    client = _openai_client()
     model = os.environ.get("OPENAI_QA_MODEL", os.environ.get("OPENAI_MODEL", "gpt-4o-mini"))
     temperature = float(os.environ.get("QA_TEMPERATURE", "0.2"))
-
-    t0 = time.perf_counter()
-    resp = client.responses.create(
-        model=model,
-        input=[
-            {"role": "system", "content": system},
-            {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False)},
-        ],
-        temperature=temperature,
+    user_content = _json_bytes(user_payload).decode("utf-8")
+    cache_key = (
+        model,
+        temperature,
+        hashlib.sha256(system.encode("utf-8")).hexdigest(),
+        hashlib.sha256(user_content.encode("utf-8")).hexdigest(),
     )
-    _ = time.perf_counter() - t0
 
-    raw = _extract_resp_text(resp).strip()
+    raw = _LLM_CACHE.get(cache_key)
+    cached = raw is not None
+    if not cached:
+        client = _openai_client()
+        t0 = time.perf_counter()
+        raw = _complete_text(
+            client,
+            model=model,
+            input=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user_content},
+            ],
+            temperature=temperature,
+        ).strip()
+        _ = time.perf_counter() - t0
+
     parsed = _safe_json_from_text(raw)
+    if parsed and not cached:
+        # only remember answers we could parse; failures get a fresh attempt
+        _LLM_CACHE.put(cache_key, raw)
     if not parsed:
         # Safe fallback (keep UX consistent)
         data = {
@@ -719,19 +1034,49 @@ def answer_question(
         conf = 0.0
     data["confidence"] = max(0.0, min(1.0, conf))
     data["mode"] = mode
+    data["source"] = "llm"
 
     return data
 
 
+async def answer_question_async(
+    *,
+    brief_id: str,
+    question: str,
+    md_text: str,
+    norm: Dict[str, Any],
+    mode: str = "report_only",
+    norm_key: Any = None,
+) -> Dict[str, Any]:
+    """
+    answer_question for async callers: the ranking/compaction CPU work and the
+    blocking OpenAI/Tavily calls run on a worker thread, so the event loop keeps
+    serving other requests meanwhile.
+    """
+    return await asyncio.to_thread(
+        answer_question,
+        brief_id=brief_id,
+        question=question,
+        md_text=md_text,
+        norm=norm,
+        mode=mode,
+        norm_key=norm_key,
+    )
+
+
 def persist_verified_log(brief_id: str, entry: Dict[str, Any], out_dir: Path) -> None:
     """
     Append a verified lookup record to outputs/<brief_id>.verified.jsonl for auditing/debugging.
     """
     try:
         path = out_dir / f"{brief_id}.verified.jsonl"
-        line = json.dumps(entry, ensure_ascii=False)
-        path.write_text("", encoding="utf-8") if not path.exists() else None
-        with path.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        data = _json_bytes(entry) + b"\n"
+        # O_APPEND creates the file on first use and keeps concurrent writers'
+        # lines whole; a single os.write per entry, no exists()/truncate step.
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
     except Exception:
         pass
@@ -15,33 +15,42 @@ import re
 from typing import Any, Dict, List, Tuple
 
 
+# Single-pass character map for _norm_dashes: no-break/thin spaces -> space,
+# invisible joiners -> removed, hyphen/dash/box glyphs -> ASCII "-".
+# normalize._clean_text builds its table on top of this one.
+DASH_TRANSLATE = str.maketrans({
+    "\u00a0": " ",
+    "\u202f": " ",
+    "\u2007": " ",
+    "\u2060": None,
+    "\u200b": None,
+    "\ufeff": None,
+    "\u2011": "-",  # non-breaking hyphen
+    "\u2010": "-",  # hyphen
+    "\u2013": "-",  # en dash
+    "\u2014": "-",  # em dash
+    "\u25a0": "-",
+    "\u25a1": "-",
+    "\u25aa": "-",
+    "\u25ab": "-",
+})
+_RE_DASH_WS = re.compile(r"\s*-\s*")
+_RE_MULTI_SPACE = re.compile(r"\s{2,}")
+_RE_NEAR_PREFIX = re.compile(r"^Near\s+", re.I)
+
+
 def _norm_dashes(s: str) -> str:
     s = s or ""
     # Remove unicode joiners/no-break spaces that can show up as black squares in PDFs.
-    s = (
-        s.replace(" ", " ")
-        .replace(" ", " ")
-        .replace(" ", " ")
-        .replace("⁠", "")
-        .replace("​", "")
-        .replace("﻿", "")
-        .replace("‑", "-")
-        .replace("‐", "-")
-        .replace("–", "-")
-        .replace("—", "-")
-        .replace("■", "-")
-        .replace("□", "-")
-        .replace("▪", "-")
-        .replace("▫", "-")
-    )
-    s = re.sub(r"\s*-\s*", "-", s)
-    s = re.sub(r"\s{2,}", " ", s)
+    s = s.translate(DASH_TRANSLATE)
+    s = _RE_DASH_WS.sub("-", s)
+    s = _RE_MULTI_SPACE.sub(" ", s)
     return s.strip()
 
 
 def _strip_near_prefix(s: str) -> str:
     s = s or ""
-    return re.sub(r"^Near\s+", "", s, flags=re.I).strip()
+    return _RE_NEAR_PREFIX.sub("", s).strip()
 
 
 def _dedupe_ci(items: List[str]) -> List[str]:
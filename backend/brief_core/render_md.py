@@ -1,4 +1,6 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+SCORE_LINE_KEYS: Tuple[str, ...] = ("Safety", "Family", "Commute", "Lifestyle", "BudgetFit", "Overall")
 
 
 def _clean(s: str) -> str:
@@ -63,8 +65,7 @@ def _links(items) -> str:
 
 
 def _score_line(scores: Dict[str, Any]) -> str:
-    keys = ["Safety", "Family", "Commute", "Lifestyle", "BudgetFit", "Overall"]
-    parts = [f"{k}:{scores[k]}" for k in keys if k in scores]
+    parts = [f"{k}:{scores[k]}" for k in SCORE_LINE_KEYS if k in scores]
     return " | ".join(parts) if parts else "—"
 
 
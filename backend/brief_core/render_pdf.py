@@ -95,7 +95,7 @@ def _truncate(text: Any, max_chars: int) -> str:
     # Fallback: word boundary.
     cut = t[: max_chars - 1].rstrip()
     if " " in cut:
-        cut = cut.rsplit(" ", 1)[0]
+        cut = cut.rpartition(" ")[0]
     return cut.rstrip(" ,.;:") + "…"
 
 